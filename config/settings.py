@@ -2,6 +2,7 @@
 
 import os
 import logging
+import threading
 from typing import Optional
 
 import boto3
@@ -23,7 +24,13 @@ logger = logging.getLogger("rising-pmax")
 
 # AWS clients
 _ssm_client: Optional[boto3.client] = None
-_dynamodb_resource: Optional[boto3.resource] = None
+# boto3 resources are not thread-safe, so each thread gets its own. They are
+# all built from one Session (its setup and model loading are the expensive
+# part), and the worker pools that touch DynamoDB are long-lived, so each
+# worker builds its resource once per process.
+_boto3_session: Optional[boto3.session.Session] = None
+_boto3_session_lock = threading.Lock()
+_thread_local = threading.local()
 
 
 def get_ssm_client():
@@ -34,10 +41,16 @@ def get_ssm_client():
 
 
 def get_dynamodb_resource():
-    global _dynamodb_resource
-    if _dynamodb_resource is None:
-        _dynamodb_resource = boto3.resource("dynamodb", region_name=AWS_REGION)
-    return _dynamodb_resource
+    global _boto3_session
+    resource = getattr(_thread_local, "dynamodb_resource", None)
+    if resource is None:
+        # Creating clients from one Session is not thread-safe; serialize it
+        with _boto3_session_lock:
+            if _boto3_session is None:
+                _boto3_session = boto3.session.Session()
+            resource = _boto3_session.resource("dynamodb", region_name=AWS_REGION)
+        _thread_local.dynamodb_resource = resource
+    return resource
 
 
 def get_parameter(name: str, encrypted: bool = True) -> str:
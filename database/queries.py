@@ -121,7 +121,35 @@ def get_latest_asset_records(campaign_name: str) -> List[Dict[str, Any]]:
         )
         items.extend(response.get("Items", []))
 
-    # Deduplicate: keep latest report_date per asset_id
+    return _latest_per_asset(items)
+
+
+def get_latest_asset_records_bulk(campaign_names: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """Latest record per asset for several campaigns from a single filtered scan.
+
+    Returns a dict keyed by every requested campaign name (empty list if
+    the campaign has no records).
+    """
+    table = _get_table("rising_asset_performance")
+    names = list(dict.fromkeys(campaign_names))
+    items_by_campaign: Dict[str, List[Dict[str, Any]]] = {name: [] for name in names}
+
+    # DynamoDB caps IN() at 100 operands
+    for start in range(0, len(names), 100):
+        scan_kwargs = {"FilterExpression": Attr("campaign_name").is_in(names[start:start + 100])}
+        while True:
+            response = table.scan(**scan_kwargs)
+            for item in response.get("Items", []):
+                items_by_campaign[item["campaign_name"]].append(item)
+            if "LastEvaluatedKey" not in response:
+                break
+            scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    return {name: _latest_per_asset(items) for name, items in items_by_campaign.items()}
+
+
+def _latest_per_asset(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Deduplicate: keep latest report_date per asset_id."""
     latest: Dict[str, Dict[str, Any]] = {}
     for item in items:
         aid = item["asset_id"]
@@ -364,6 +392,24 @@ def get_images_for_campaign(campaign_name: str) -> List[Dict[str, Any]]:
     return result
 
 
+def get_images_for_campaigns(campaign_names: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """Images currently linked to each of several campaigns, from one registry scan.
+
+    Returns a dict keyed by every requested campaign name.
+    """
+    result: Dict[str, List[Dict[str, Any]]] = {name: [] for name in campaign_names}
+    for image in get_all_images():
+        linked = {
+            mapping.get("campaign_name")
+            for mapping in image.get("google_ads_assets", [])
+            if not mapping.get("date_unlinked")
+        }
+        for name in linked:
+            if name in result:
+                result[name].append(image)
+    return result
+
+
 def lookup_image_by_asset_resource(asset_resource: str) -> Optional[Dict[str, Any]]:
     """Find an image by its Google Ads asset resource name."""
     all_images = get_all_images()
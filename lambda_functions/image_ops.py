@@ -268,7 +268,12 @@ def _handle_analyze(event):
     # Download and re-analyze
     image_bytes = manager.download_from_s3(image["s3_key"])
     content_type = "image/png" if image["s3_key"].endswith(".png") else "image/jpeg"
-    analysis = manager.analyze_image(image_bytes, content_type, campaign_context=campaign_context)
+    analysis = manager.analyze_image(
+        image_bytes,
+        content_type,
+        campaign_context=campaign_context,
+        image_url=manager.presigned_url(image["s3_key"]),
+    )
 
     from datetime import datetime
     now = datetime.utcnow().isoformat() + "Z"
@@ -316,27 +321,27 @@ def _handle_audit(event):
 
     from src.campaign_auditor import CampaignAuditor
 
-    auditor = CampaignAuditor(campaign_config, anthropic_api_key=anthropic_key)
-
-    if campaigns_filter:
-        # Audit specific campaigns
-        campaign_results = {}
-        all_findings = []
-        for campaign_name in campaigns_filter:
-            result = auditor.audit_campaign(campaign_name)
-            campaign_results[campaign_name] = result
-            all_findings.extend(result["findings"])
-
-        summary_data = auditor._generate_summary(all_findings, campaign_results)
-        results = {
-            "campaigns": campaign_results,
-            "summary": summary_data.get("summary", ""),
-            "recommendations": summary_data.get("recommendations", []),
-            "season": auditor.season,
-            "month": auditor.month,
-        }
-    else:
-        results = auditor.audit_all()
+    with CampaignAuditor(campaign_config, anthropic_api_key=anthropic_key) as auditor:
+        if campaigns_filter:
+            # Audit specific campaigns
+            campaign_results = {}
+            all_findings = []
+            auditor.prefetch(campaigns_filter)
+            for campaign_name in campaigns_filter:
+                result = auditor.audit_campaign(campaign_name)
+                campaign_results[campaign_name] = result
+                all_findings.extend(result["findings"])
+
+            summary_data = auditor._generate_summary(all_findings, campaign_results)
+            results = {
+                "campaigns": campaign_results,
+                "summary": summary_data.get("summary", ""),
+                "recommendations": summary_data.get("recommendations", []),
+                "season": auditor.season,
+                "month": auditor.month,
+            }
+        else:
+            results = auditor.audit_all()
 
     # Post to Slack
     slack_sent = False
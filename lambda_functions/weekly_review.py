@@ -39,7 +39,6 @@ from src.analyzer import (
     calculate_budget_recommendation,
     check_emergency_conditions,
 )
-from src.copy_generator import CopyGenerator
 from src.csv_builder import CSVBuilder
 from src.data_collector import GoogleAdsCollector
 from src.shopify_collector import ShopifyCollector
@@ -105,6 +104,23 @@ def lambda_handler(event, context):
         all_emergency_alerts = []
         all_sitelinks = {}
 
+        lookback = thresholds["lookback_days"]
+        lookback_start = get_lookback_date(lookback)
+
+        # Collect text/image asset performance, campaign metrics, and budget
+        # for every configured campaign in one concurrent round
+        campaign_ids = {
+            name: cfg["campaign_id"]
+            for name, cfg in CAMPAIGNS.items()
+            if cfg.get("campaign_id")
+        }
+        bundles = collector.collect_bundles(
+            campaign_ids, start_date=lookback_start, end_date=today
+        )
+        settings_by_id = collector.get_campaign_settings_bulk(
+            list(campaign_ids.values())
+        )
+
         for campaign_name, campaign_config in CAMPAIGNS.items():
             campaign_id = campaign_config.get("campaign_id")
             if not campaign_id:
@@ -116,30 +132,15 @@ def lambda_handler(event, context):
             logger.info("Processing campaign: %s", campaign_name)
 
             # Skip paused campaigns
-            settings = collector.get_campaign_settings(campaign_id)
+            settings = settings_by_id[str(campaign_id)]
             status = settings.get("campaign_status", "")
             if status == "PAUSED":
                 logger.info("Campaign '%s' is PAUSED, skipping", campaign_name)
                 continue
 
-            lookback = thresholds["lookback_days"]
-            lookback_start = get_lookback_date(lookback)
-
-            # Collect text asset performance
-            assets = collector.collect_for_campaign(
-                campaign_name=campaign_name,
-                campaign_id=campaign_id,
-                start_date=lookback_start,
-                end_date=today,
-            )
-
-            # Collect image asset performance
-            image_assets = collector.collect_images_for_campaign(
-                campaign_name=campaign_name,
-                campaign_id=campaign_id,
-                start_date=lookback_start,
-                end_date=today,
-            )
+            bundle = bundles[campaign_name]
+            assets = bundle["assets"]
+            image_assets = bundle["image_assets"]
 
             # Separate sitelinks from text assets (different query level)
             sitelinks = [a for a in assets if a.get("asset_type") == "SITELINK"]
@@ -182,6 +183,9 @@ def lambda_handler(event, context):
                     logger.info("Step 6: Generating replacements for %d text assets", len(flagged))
                     if flagged:
                         try:
+                            # Deferred: only weeks with flagged assets need the anthropic SDK
+                            from src.copy_generator import CopyGenerator
+
                             generator = CopyGenerator(api_key=anthropic_key)
                             replacements = generator.generate_replacements(flagged, graveyard)
                         except Exception as e:
@@ -200,18 +204,16 @@ def lambda_handler(event, context):
             # Step 7: Calculate budget performance (Shopify ROAS)
             logger.info("Step 7: Calculating budget performance with Shopify revenue")
 
-            # Get campaign-level metrics from Google Ads
-            campaign_metrics = collector.get_campaign_metrics(
-                campaign_id, start_date=lookback_start, end_date=today
-            )
+            # Campaign-level metrics from Google Ads (fetched in Step 3)
+            campaign_metrics = bundle["metrics"]
             total_spend = campaign_metrics["total_spend"]
             campaign_ctr = campaign_metrics["ctr"]
             campaign_clicks = campaign_metrics["clicks"]
             campaign_impressions = campaign_metrics["impressions"]
             actual_daily_avg = total_spend / lookback if lookback > 0 else 0
 
-            # Get actual campaign budget from Google Ads
-            daily_budget_target = collector.get_campaign_budget(campaign_id)
+            # Actual campaign budget from Google Ads (fetched in Step 3)
+            daily_budget_target = bundle["budget"]
             if daily_budget_target <= 0:
                 daily_budget_target = seasonal_budget["recommended_daily"]
                 logger.warning("Using seasonal budget fallback: $%.2f", daily_budget_target)
@@ -1,7 +1,8 @@
 """Analysis engine for flagging underperforming assets."""
 
 import logging
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Union
 
 from config.thresholds import get_season_name, get_thresholds, get_monthly_demand
 from utils.date_helpers import days_since, get_current_month
@@ -20,6 +21,82 @@ KNOWN_FAILURE_PATTERNS = [
     "monsters",
 ]
 
+# Weeks of history averaged for the CTR collapse alert
+CTR_HISTORY_WEEKS = 4
+
+# Reason templates (%-style, formatted once per flagged asset / recommendation)
+_CTR_REASON_TMPL = "CTR %.2f%% below %s threshold %.1f%% for %s (%d impressions)"
+_MARKET_CEILING_TMPL = (
+    "Market ceiling detected. Only spending $%.0f/day of $%.0f budget. "
+    "Cannot efficiently scale further."
+)
+_ROAS_INCREASE_TMPL = (
+    "ROAS %.0f%% exceeds target %.0f%% by %.0f%%. Recommend +20%% budget increase."
+)
+_ROAS_HOLD_TMPL = "ROAS %.0f%% on target (%.0f%%). Hold budget steady."
+_ROAS_DECREASE_TMPL = (
+    "ROAS %.0f%% is %.0f%% below target %.0f%%. Recommend -20%% budget decrease."
+)
+_ROAS_PAUSE_TMPL = (
+    "ROAS %.0f%% critically low (target %.0f%%). "
+    "Recommend reducing to maintenance mode ($10/day) until performance recovers."
+)
+
+# Statuses that are never re-flagged
+_SKIP_STATUSES = frozenset(("killed", "paused"))
+
+# Asset type -> threshold key for the CTR kill check
+CTR_THRESHOLD_KEYS = {
+    "HEADLINE": "min_ctr_headline",
+    "LONG_HEADLINE": "min_ctr_long_headline",
+    "DESCRIPTION": "min_ctr_description",
+    "MARKETING_IMAGE": "min_ctr_marketing_image",
+    "SQUARE_MARKETING_IMAGE": "min_ctr_square_marketing_image",
+    "PORTRAIT_MARKETING_IMAGE": "min_ctr_portrait_marketing_image",
+}
+
+
+@dataclass(slots=True)
+class Asset:
+    """Typed, slotted view of the asset fields the analyzer reads.
+
+    Collector and DynamoDB records arrive as plain dicts; converting them
+    once up front replaces repeated ``dict.get`` + casts with attribute access.
+    """
+
+    asset_text: str = ""
+    asset_type: str = "HEADLINE"
+    impressions: int = 0
+    ctr: float = 0.0
+    date_added: Optional[str] = None
+    status: str = "active"
+    kill_reason: Optional[str] = None
+    diagnosis: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Asset":
+        """Build an Asset from a collector/DynamoDB asset dict."""
+        return cls(
+            asset_text=data.get("asset_text", ""),
+            asset_type=data.get("asset_type", "HEADLINE"),
+            impressions=int(data.get("impressions", 0)),
+            ctr=float(data.get("ctr", 0.0)),
+            date_added=data.get("date_added"),
+            status=data.get("status", "active"),
+            kill_reason=data.get("kill_reason"),
+            diagnosis=data.get("diagnosis"),
+        )
+
+
+AssetLike = Union[Asset, Dict[str, Any]]
+
+
+def _as_asset(asset: AssetLike) -> Asset:
+    """Accept either an Asset or a legacy asset dict."""
+    if isinstance(asset, Asset):
+        return asset
+    return Asset.from_dict(asset)
+
 
 class AssetAnalyzer:
     """Analyzes asset performance and flags underperformers."""
@@ -30,6 +107,10 @@ class AssetAnalyzer:
         self.season = get_season_name(self.month)
         self.thresholds = get_thresholds(self.month)
         self.demand = get_monthly_demand(self.month)
+        self.min_ctr_by_type = {
+            asset_type: self.thresholds[key]
+            for asset_type, key in CTR_THRESHOLD_KEYS.items()
+        }
         logger.info(
             "Analyzer initialized: season=%s, month=%d, demand=%.1f%%",
             self.season,
@@ -37,19 +118,20 @@ class AssetAnalyzer:
             self.demand,
         )
 
-    def is_new_asset(self, asset: Dict[str, Any]) -> bool:
+    def is_new_asset(self, asset: AssetLike) -> bool:
         """Check if an asset is too new to judge.
 
         An asset is considered new if:
         - It has been active for fewer than patience_days, AND
         - It has fewer than patience_impressions
         """
-        date_added = asset.get("date_added")
+        asset = _as_asset(asset)
+        date_added = asset.date_added
         if not date_added:
             return False
 
         age_days = days_since(date_added)
-        impressions = int(asset.get("impressions", 0))
+        impressions = asset.impressions
         patience_days = self.thresholds["new_asset_patience_days"]
         patience_impr = self.thresholds["new_asset_patience_impressions"]
 
@@ -58,20 +140,21 @@ class AssetAnalyzer:
         if is_new:
             logger.debug(
                 "Asset '%s' is new (%d days, %d impr)",
-                asset.get("asset_text", "?"),
+                asset.asset_text or "?",
                 age_days,
                 impressions,
             )
         return is_new
 
-    def should_kill(self, asset: Dict[str, Any]) -> Optional[str]:
+    def should_kill(self, asset: AssetLike) -> Optional[str]:
         """Apply kill criteria and return reason if asset should be killed.
 
         Returns None if asset should be kept, or a reason string if it should die.
         """
-        asset_type = asset.get("asset_type", "HEADLINE")
-        impressions = int(asset.get("impressions", 0))
-        ctr = float(asset.get("ctr", 0.0))
+        asset = _as_asset(asset)
+        asset_type = asset.asset_type
+        impressions = asset.impressions
+        ctr = asset.ctr
 
         min_impressions = self.thresholds["min_impressions"]
 
@@ -80,27 +163,29 @@ class AssetAnalyzer:
             return None
 
         # CTR-only flagging (conversion data is unreliable at asset level in PMax)
-        ctr_key = {
-            "HEADLINE": "min_ctr_headline",
-            "LONG_HEADLINE": "min_ctr_long_headline",
-            "DESCRIPTION": "min_ctr_description",
-            "MARKETING_IMAGE": "min_ctr_marketing_image",
-            "SQUARE_MARKETING_IMAGE": "min_ctr_square_marketing_image",
-            "PORTRAIT_MARKETING_IMAGE": "min_ctr_portrait_marketing_image",
-        }.get(asset_type)
-
-        if ctr_key:
-            min_ctr = self.thresholds[ctr_key]
-            if ctr < min_ctr:
-                return (
-                    f"CTR {ctr:.2f}% below {self.season} threshold "
-                    f"{min_ctr:.1f}% for {asset_type} ({impressions} impressions)"
-                )
+        min_ctr = self.min_ctr_by_type.get(asset_type)
+        if min_ctr is not None and ctr < min_ctr:
+            return self._kill_reason(asset_type, ctr, min_ctr, impressions)
 
         return None
 
+    def _kill_reason(
+        self, asset_type: str, ctr: float, min_ctr: float, impressions: int
+    ) -> str:
+        return _CTR_REASON_TMPL % (ctr, self.season, min_ctr, asset_type, impressions)
+
+    def _evaluate(self, asset: Asset) -> Optional[str]:
+        """Run kill and patience checks in one pass over an active asset.
+
+        The kill criteria are should_kill's; the patience check (and its date
+        parse) only runs for assets that would otherwise be killed. Returns
+        the kill reason, or None if the asset should be kept.
+        """
+        reason = self.should_kill(asset)
+        return reason if reason and not self.is_new_asset(asset) else None
+
     def diagnose_failure(
-        self, asset: Dict[str, Any], graveyard: List[Dict[str, Any]]
+        self, asset: AssetLike, graveyard: List[Dict[str, Any]]
     ) -> str:
         """Determine why an asset failed for copy generation guidance.
 
@@ -110,7 +195,8 @@ class AssetAnalyzer:
         - specificity: Too vague or generic
         - length: Poor use of character limit
         """
-        asset_type = asset.get("asset_type", "")
+        asset = _as_asset(asset)
+        asset_type = asset.asset_type
 
         # Image assets: skip text-based analysis
         if asset_type in (
@@ -120,7 +206,7 @@ class AssetAnalyzer:
         ):
             return "visual_fatigue: Image underperforming. Consider replacing with fresh creative."
 
-        text = asset.get("asset_text", "").lower()
+        text = asset.asset_text.lower()
 
         # Check for voice violations (hype language)
         for pattern in KNOWN_FAILURE_PATTERNS:
@@ -166,26 +252,27 @@ class AssetAnalyzer:
         """
         graveyard = graveyard or []
         flagged = []
+        log_flags = logger.isEnabledFor(logging.INFO)
 
-        for asset in assets:
-            # Skip new assets (patience period)
-            if self.is_new_asset(asset):
-                continue
-
-            # Skip already killed/paused
-            if asset.get("status") in ("killed", "paused"):
+        for record in assets:
+            # Skip already killed/paused before any other work
+            if record.get("status") in _SKIP_STATUSES:
                 continue
 
-            kill_reason = self.should_kill(asset)
+            asset = _as_asset(record)
+            kill_reason = self._evaluate(asset)
             if kill_reason:
-                asset["kill_reason"] = kill_reason
-                asset["diagnosis"] = self.diagnose_failure(asset, graveyard)
-                flagged.append(asset)
-                logger.info(
-                    "Flagged: '%s' - %s",
-                    asset.get("asset_text", "?"),
-                    kill_reason,
-                )
+                asset.kill_reason = kill_reason
+                asset.diagnosis = self.diagnose_failure(asset, graveyard)
+                record["kill_reason"] = asset.kill_reason
+                record["diagnosis"] = asset.diagnosis
+                flagged.append(record)
+                if log_flags:
+                    logger.info(
+                        "Flagged: '%s' - %s",
+                        asset.asset_text or "?",
+                        kill_reason,
+                    )
 
         logger.info(
             "Flagged %d of %d assets for replacement", len(flagged), len(assets)
@@ -220,12 +307,7 @@ def calculate_budget_recommendation(
         return {
             "action": "hold",
             "recommended_budget": current_daily_budget,
-            "reason": (
-                f"Market ceiling detected. Only spending "
-                f"${actual_daily_spend_avg:.0f}/day of "
-                f"${current_daily_budget:.0f} budget. "
-                f"Cannot efficiently scale further."
-            ),
+            "reason": _MARKET_CEILING_TMPL % (actual_daily_spend_avg, current_daily_budget),
             "market_ceiling_detected": True,
         }
 
@@ -239,9 +321,8 @@ def calculate_budget_recommendation(
         return {
             "action": "increase",
             "recommended_budget": round(current_daily_budget + increase, 2),
-            "reason": (
-                f"ROAS {current_roas:.0f}% exceeds target {target_roas:.0f}% "
-                f"by {roas_performance * 100:.0f}%. Recommend +20% budget increase."
+            "reason": _ROAS_INCREASE_TMPL % (
+                current_roas, target_roas, roas_performance * 100,
             ),
             "market_ceiling_detected": False,
         }
@@ -250,10 +331,7 @@ def calculate_budget_recommendation(
         return {
             "action": "hold",
             "recommended_budget": current_daily_budget,
-            "reason": (
-                f"ROAS {current_roas:.0f}% on target ({target_roas:.0f}%). "
-                f"Hold budget steady."
-            ),
+            "reason": _ROAS_HOLD_TMPL % (current_roas, target_roas),
             "market_ceiling_detected": False,
         }
 
@@ -262,10 +340,8 @@ def calculate_budget_recommendation(
         return {
             "action": "decrease",
             "recommended_budget": max(round(current_daily_budget - decrease, 2), 10.0),
-            "reason": (
-                f"ROAS {current_roas:.0f}% is "
-                f"{abs(roas_performance) * 100:.0f}% below target {target_roas:.0f}%. "
-                f"Recommend -20% budget decrease."
+            "reason": _ROAS_DECREASE_TMPL % (
+                current_roas, abs(roas_performance) * 100, target_roas,
             ),
             "market_ceiling_detected": False,
         }
@@ -274,10 +350,7 @@ def calculate_budget_recommendation(
     return {
         "action": "pause",
         "recommended_budget": 10.0,
-        "reason": (
-            f"ROAS {current_roas:.0f}% critically low (target {target_roas:.0f}%). "
-            f"Recommend reducing to maintenance mode ($10/day) until performance recovers."
-        ),
+        "reason": _ROAS_PAUSE_TMPL % (current_roas, target_roas),
         "market_ceiling_detected": False,
     }
 
@@ -298,9 +371,16 @@ def check_emergency_conditions(
     # Alert 1: CTR collapse
     if history and len(history) >= 2:
         current_ctr = float(budget_data.get("avg_ctr", 0))
-        recent_ctrs = [float(h.get("avg_ctr", 0)) for h in history[:4] if h.get("avg_ctr")]
-        if recent_ctrs:
-            avg_recent_ctr = sum(recent_ctrs) / len(recent_ctrs)
+        # Single pass running mean over weeks that reported a CTR
+        ctr_total = 0.0
+        ctr_weeks = 0
+        for week in history[:CTR_HISTORY_WEEKS]:
+            week_ctr = week.get("avg_ctr")
+            if week_ctr:
+                ctr_total += float(week_ctr)
+                ctr_weeks += 1
+        if ctr_weeks:
+            avg_recent_ctr = ctr_total / ctr_weeks
             if avg_recent_ctr > 0 and current_ctr < (avg_recent_ctr * 0.5):
                 alerts.append(
                     {
@@ -4,32 +4,58 @@ Runs 20 checks across 5 categories, scores campaign health,
 and generates a Slack report with findings and recommendations.
 """
 
+import bisect
 import json
 import logging
-import re
-from datetime import datetime, timedelta
+import math
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from enum import StrEnum
+from functools import lru_cache
+from itertools import pairwise
 from typing import Any, Dict, List, Tuple
 
-import requests
+import anthropic
 
 from config.thresholds import get_season_name, get_seasonal_budget
 from database.queries import (
     get_budget_history,
     get_graveyard_assets,
     get_images_for_campaign,
+    get_images_for_campaigns,
     get_latest_asset_records,
+    get_latest_asset_records_bulk,
 )
 from src.image_manager import CONTENT_CATEGORIES, _dedupe_campaign_images
 from utils.date_helpers import get_current_month
 
 logger = logging.getLogger("rising-pmax.auditor")
 
+# Max campaigns audited concurrently (checks are I/O-bound DynamoDB reads)
+AUDIT_MAX_WORKERS = 8
+
+# Long-lived so each worker thread keeps its DynamoDB resource across audits
+_audit_executor = ThreadPoolExecutor(
+    max_workers=AUDIT_MAX_WORKERS, thread_name_prefix="audit"
+)
+
+
+class Severity(StrEnum):
+    """Finding severity. Members are str, so findings still serialize as plain names."""
+
+    CRITICAL = "CRITICAL"
+    WARNING = "WARNING"
+    INFO = "INFO"
+    PASS = "PASS"
+
+
 # Severity deductions for health score
 SEVERITY_DEDUCTIONS = {
-    "CRITICAL": 15,
-    "WARNING": 5,
-    "INFO": 0,
-    "PASS": 0,
+    Severity.CRITICAL: 15,
+    Severity.WARNING: 5,
+    Severity.INFO: 0,
+    Severity.PASS: 0,
 }
 
 # Grade thresholds (checked in order, first match wins)
@@ -41,12 +67,135 @@ GRADE_SCALE = [
     (0, "F"),
 ]
 
+# Ascending cut points for bisect lookup, derived from GRADE_SCALE
+_GRADE_CUTS = [threshold for threshold, _ in reversed(GRADE_SCALE)]
+_GRADE_LETTERS = [letter for _, letter in reversed(GRADE_SCALE)]
+
+# Manual strategy fields every campaign config should fill in
+REQUIRED_MANUAL_FIELDS = ("description", "goal", "target_audience", "key_products", "tone_notes")
+
+# Image field types every campaign needs (landscape, square, portrait)
+REQUIRED_IMAGE_FORMATS = frozenset(
+    ("MARKETING_IMAGE", "SQUARE_MARKETING_IMAGE", "PORTRAIT_MARKETING_IMAGE")
+)
+_REQUIRED_IMAGE_FORMATS_SORTED = sorted(REQUIRED_IMAGE_FORMATS)
+
 AUDIT_SUMMARY_PROMPT = """You are a Google Ads Performance Max campaign health advisor. Given these audit findings for a fly fishing brand, write: (1) a 2-3 sentence executive summary of overall campaign health, and (2) a prioritized list of 3-5 specific actions to take. Be direct and specific. Return JSON: {{"summary": "...", "recommendations": ["...", "..."]}}
 
 Audit findings:
 {findings_json}"""
 
 
+# Bound each summary call; the SDK retries 429/5xx with jittered exponential backoff
+CLAUDE_TIMEOUT = anthropic.Timeout(30.0, connect=5.0)
+
+# Forced tool call so the summary arrives as parsed JSON in the response body
+AUDIT_SUMMARY_TOOL = {
+    "name": "emit_summary",
+    "description": "Record the audit executive summary and prioritized recommendations.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "summary": {"type": "string"},
+            "recommendations": {"type": "array", "items": {"type": "string"}},
+        },
+        "required": ["summary", "recommendations"],
+    },
+}
+
+
+@lru_cache(maxsize=4)
+def _anthropic_client(api_key: str) -> anthropic.Anthropic:
+    """One SDK client (and connection pool) per API key for the process lifetime."""
+    return anthropic.Anthropic(api_key=api_key, max_retries=3, timeout=CLAUDE_TIMEOUT)
+
+
+def _extract_summary(content: List[Any]) -> Dict[str, Any]:
+    """Pull summary data from a Messages API response's content blocks.
+
+    Prefers the emit_summary tool input; falls back to parsing a JSON text
+    block (optionally fenced) if the model answered in text instead.
+    """
+    for block in content:
+        if block.type == "tool_use" and block.name == AUDIT_SUMMARY_TOOL["name"]:
+            return block.input or {}
+
+    text = next(block.text for block in content if block.type == "text").strip()
+    if text.startswith("```"):
+        text = text.split("\n", 1)[1].rsplit("```", 1)[0].strip()
+    return json.loads(text)
+
+
+def _finding(
+    check: str, category: str, severity: Severity, message: str, value: Any, expected: Any
+) -> Dict[str, Any]:
+    """Build a single audit finding dict."""
+    return {
+        "check": check,
+        "category": category,
+        "severity": severity,
+        "message": message,
+        "value": value,
+        "expected": expected,
+    }
+
+
+def _group_by_severity(findings: List[Dict[str, Any]]) -> Dict[Severity, List[Dict[str, Any]]]:
+    """Split findings into per-severity lists in one pass, preserving order."""
+    buckets: Dict[Severity, List[Dict[str, Any]]] = {severity: [] for severity in Severity}
+    for finding in findings:
+        bucket = buckets.get(finding["severity"])
+        if bucket is not None:
+            bucket.append(finding)
+    return buckets
+
+
+def _pass_fail(
+    check: str,
+    category: str,
+    ok: bool,
+    pass_message: str,
+    fail_message: str,
+    value: Any,
+    expected: Any,
+    fail_severity: Severity = Severity.WARNING,
+) -> Dict[str, Any]:
+    """Build the PASS finding when ok, otherwise the failing one."""
+    if ok:
+        return _finding(check, category, Severity.PASS, pass_message, value, expected)
+    return _finding(check, category, fail_severity, fail_message, value, expected)
+
+
+def _trend_stats(
+    roas_series: List[float], spend_series: List[float], util_series: List[float]
+) -> Tuple[int, float, int, float]:
+    """Reduce newest-first weekly series to the numbers the trend checks need.
+
+    Returns (consecutive ROAS declines, max week-to-week spend swing %,
+    consecutive weeks under 50% utilization, latest utilization).
+    """
+    declining_count = 0
+    for newer, older in pairwise(roas_series):
+        if newer < older:
+            declining_count += 1
+        else:
+            break
+
+    max_swing = max(
+        (abs(newer - older) / older * 100 for newer, older in pairwise(spend_series) if older > 0),
+        default=0,
+    )
+
+    low_util_weeks = 0
+    for util in util_series:
+        if util < 50:
+            low_util_weeks += 1
+        else:
+            break
+
+    return declining_count, max_swing, low_util_weeks, util_series[0]
+
+
 class CampaignAuditor:
     """Runs health checks on PMax campaigns and generates reports."""
 
@@ -56,17 +205,89 @@ class CampaignAuditor:
         self.month = get_current_month()
         self.season = get_season_name(self.month)
         self.seasonal_budget = get_seasonal_budget(self.month)
+        # Single "as of" time for the whole audit
+        self._now_utc = datetime.now(timezone.utc)
+
+        # Shared per API key so warm invocations reuse pooled connections
+        self.client = _anthropic_client(anthropic_api_key) if anthropic_api_key else None
+
+        # Per-run caches for DynamoDB reads (live as long as this auditor)
+        self._cached_budget_history = lru_cache(maxsize=128)(get_budget_history)
+        self._cached_asset_records = lru_cache(maxsize=128)(get_latest_asset_records)
+        self._cached_campaign_images = lru_cache(maxsize=128)(get_images_for_campaign)
+        self._cached_graveyard = lru_cache(maxsize=128)(get_graveyard_assets)
+
+        # Bulk-loaded per-campaign data (see prefetch); takes precedence over the caches
+        self._prefetched_assets: Dict[str, List[Dict[str, Any]]] = {}
+        self._prefetched_images: Dict[str, List[Dict[str, Any]]] = {}
+
+    def close(self) -> None:
+        """Release per-run data (the Anthropic client is shared and stays open)."""
+        self.clear_cache()
+
+    def __enter__(self) -> "CampaignAuditor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def clear_cache(self) -> None:
+        """Drop cached DynamoDB reads so the next audit sees fresh data."""
+        self._cached_budget_history.cache_clear()
+        self._cached_asset_records.cache_clear()
+        self._cached_campaign_images.cache_clear()
+        self._cached_graveyard.cache_clear()
+        self._prefetched_assets = {}
+        self._prefetched_images = {}
+
+    def prefetch(self, campaign_names: List[str]) -> None:
+        """Load asset records and images for many campaigns with one scan each.
+
+        Campaigns not covered here (or if a bulk read fails) fall back to
+        per-campaign reads inside the checks.
+        """
+        try:
+            self._prefetched_assets = get_latest_asset_records_bulk(campaign_names)
+        except Exception as e:
+            logger.warning("Bulk asset load failed, falling back to per-campaign reads: %s", e)
+        try:
+            self._prefetched_images = get_images_for_campaigns(campaign_names)
+        except Exception as e:
+            logger.warning("Bulk image load failed, falling back to per-campaign reads: %s", e)
+
+    def _asset_records(self, campaign_name: str) -> List[Dict[str, Any]]:
+        records = self._prefetched_assets.get(campaign_name)
+        if records is None:
+            records = self._cached_asset_records(campaign_name)
+        return records
+
+    def _campaign_images(self, campaign_name: str) -> List[Dict[str, Any]]:
+        images = self._prefetched_images.get(campaign_name)
+        if images is None:
+            images = self._cached_campaign_images(campaign_name)
+        return images
+
+    def _elapsed_since(self, dt: datetime) -> timedelta:
+        """Time between dt and the audit's as-of time; naive datetimes are taken as UTC."""
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return self._now_utc - dt
 
     def audit_all(self) -> Dict[str, Any]:
         """Run audit for all campaigns and generate cross-campaign summary."""
-        campaigns = self.campaign_config.get("campaigns", {})
+        self.clear_cache()
+        self._now_utc = datetime.now(timezone.utc)
+        campaign_names = list(self.campaign_config.get("campaigns", {}))
         campaign_results = {}
         all_findings = []
 
-        for campaign_name in campaigns:
-            result = self.audit_campaign(campaign_name)
-            campaign_results[campaign_name] = result
-            all_findings.extend(result["findings"])
+        if campaign_names:
+            self.prefetch(campaign_names)
+            results = list(_audit_executor.map(self.audit_campaign, campaign_names))
+
+            for campaign_name, result in zip(campaign_names, results):
+                campaign_results[campaign_name] = result
+                all_findings.extend(result["findings"])
 
         summary_data = self._generate_summary(all_findings, campaign_results)
 
@@ -82,6 +303,20 @@ class CampaignAuditor:
         """Run all 20 checks for a single campaign."""
         campaign_data = self.campaign_config.get("campaigns", {}).get(campaign_name, {})
 
+        # Nothing to check against — report once instead of failing every check
+        if not campaign_data:
+            return {
+                "campaign_name": campaign_name,
+                "health_score": 0,
+                "grade": "F",
+                "findings": [_finding(
+                    "campaign_not_configured", "config_completeness", Severity.CRITICAL,
+                    f"No config found for {campaign_name}",
+                    value=None,
+                    expected="Campaign config present",
+                )],
+            }
+
         findings = []
         findings.extend(self._check_config_completeness(campaign_name, campaign_data))
         findings.extend(self._check_google_ads_alignment(campaign_name, campaign_data))
@@ -108,128 +343,106 @@ class CampaignAuditor:
         google_settings = campaign_data.get("google_ads_settings", {})
 
         # Check 1: Manual strategy fields populated
-        required_fields = ["description", "goal", "target_audience", "key_products", "tone_notes"]
-        missing = [f for f in required_fields if not manual.get(f)]
+        present, missing = [], []
+        for field in REQUIRED_MANUAL_FIELDS:
+            (present if manual.get(field) else missing).append(field)
 
         if missing:
-            findings.append({
-                "check": "manual_strategy_fields",
-                "category": "config_completeness",
-                "severity": "WARNING",
-                "message": f"Missing manual strategy fields: {', '.join(missing)}",
-                "value": [f for f in required_fields if manual.get(f)],
-                "expected": required_fields,
-            })
+            findings.append(_finding(
+                "manual_strategy_fields", "config_completeness", Severity.WARNING,
+                f"Missing manual strategy fields: {', '.join(missing)}",
+                value=present,
+                expected=list(REQUIRED_MANUAL_FIELDS),
+            ))
         else:
-            findings.append({
-                "check": "manual_strategy_fields",
-                "category": "config_completeness",
-                "severity": "PASS",
-                "message": "All manual strategy fields populated",
-                "value": required_fields,
-                "expected": required_fields,
-            })
+            findings.append(_finding(
+                "manual_strategy_fields", "config_completeness", Severity.PASS,
+                "All manual strategy fields populated",
+                value=present,
+                expected=list(REQUIRED_MANUAL_FIELDS),
+            ))
 
         # Check 2: Google Ads settings synced recently
         synced_at = google_settings.get("synced_at")
 
         if not synced_at:
-            findings.append({
-                "check": "google_ads_sync",
-                "category": "config_completeness",
-                "severity": "WARNING",
-                "message": "Google Ads settings have never been synced",
-                "value": None,
-                "expected": "Synced within 48 hours",
-            })
+            findings.append(_finding(
+                "google_ads_sync", "config_completeness", Severity.WARNING,
+                "Google Ads settings have never been synced",
+                value=None,
+                expected="Synced within 48 hours",
+            ))
         else:
             try:
-                synced_dt = datetime.fromisoformat(synced_at.replace("Z", "+00:00"))
-                now = datetime.utcnow().replace(tzinfo=synced_dt.tzinfo)
-                hours_ago = (now - synced_dt).total_seconds() / 3600
+                synced_dt = datetime.fromisoformat(synced_at)
+                hours_ago = self._elapsed_since(synced_dt).total_seconds() / 3600
 
                 if hours_ago > 48:
-                    findings.append({
-                        "check": "google_ads_sync",
-                        "category": "config_completeness",
-                        "severity": "WARNING",
-                        "message": f"Google Ads settings last synced {hours_ago:.0f} hours ago",
-                        "value": f"{hours_ago:.0f} hours",
-                        "expected": "Within 48 hours",
-                    })
+                    findings.append(_finding(
+                        "google_ads_sync", "config_completeness", Severity.WARNING,
+                        f"Google Ads settings last synced {hours_ago:.0f} hours ago",
+                        value=f"{hours_ago:.0f} hours",
+                        expected="Within 48 hours",
+                    ))
                 else:
-                    findings.append({
-                        "check": "google_ads_sync",
-                        "category": "config_completeness",
-                        "severity": "PASS",
-                        "message": f"Google Ads settings synced {hours_ago:.0f} hours ago",
-                        "value": f"{hours_ago:.0f} hours",
-                        "expected": "Within 48 hours",
-                    })
+                    findings.append(_finding(
+                        "google_ads_sync", "config_completeness", Severity.PASS,
+                        f"Google Ads settings synced {hours_ago:.0f} hours ago",
+                        value=f"{hours_ago:.0f} hours",
+                        expected="Within 48 hours",
+                    ))
             except (ValueError, TypeError):
-                findings.append({
-                    "check": "google_ads_sync",
-                    "category": "config_completeness",
-                    "severity": "WARNING",
-                    "message": f"Could not parse sync timestamp: {synced_at}",
-                    "value": synced_at,
-                    "expected": "Valid ISO timestamp within 48 hours",
-                })
+                findings.append(_finding(
+                    "google_ads_sync", "config_completeness", Severity.WARNING,
+                    f"Could not parse sync timestamp: {synced_at}",
+                    value=synced_at,
+                    expected="Valid ISO timestamp within 48 hours",
+                ))
 
         # Check 3: Image profile defined and sums to ~1.0
         image_profile = campaign_data.get("image_profile", {})
 
         if not image_profile:
-            findings.append({
-                "check": "image_profile",
-                "category": "config_completeness",
-                "severity": "WARNING",
-                "message": "No image profile defined",
-                "value": None,
-                "expected": "Image profile with values summing to ~1.0",
-            })
+            findings.append(_finding(
+                "image_profile", "config_completeness", Severity.WARNING,
+                "No image profile defined",
+                value=None,
+                expected="Image profile with values summing to ~1.0",
+            ))
         else:
-            profile_sum = sum(float(v) for v in image_profile.values())
+            profile_sum = math.fsum(map(float, image_profile.values()))
             if 0.95 <= profile_sum <= 1.05:
-                findings.append({
-                    "check": "image_profile",
-                    "category": "config_completeness",
-                    "severity": "PASS",
-                    "message": f"Image profile defined, sums to {profile_sum:.2f}",
-                    "value": profile_sum,
-                    "expected": "0.95 - 1.05",
-                })
+                findings.append(_finding(
+                    "image_profile", "config_completeness", Severity.PASS,
+                    f"Image profile defined, sums to {profile_sum:.2f}",
+                    value=profile_sum,
+                    expected="0.95 - 1.05",
+                ))
             else:
-                findings.append({
-                    "check": "image_profile",
-                    "category": "config_completeness",
-                    "severity": "WARNING",
-                    "message": f"Image profile sums to {profile_sum:.2f} (should be ~1.0)",
-                    "value": profile_sum,
-                    "expected": "0.95 - 1.05",
-                })
+                findings.append(_finding(
+                    "image_profile", "config_completeness", Severity.WARNING,
+                    f"Image profile sums to {profile_sum:.2f} (should be ~1.0)",
+                    value=profile_sum,
+                    expected="0.95 - 1.05",
+                ))
 
         # Check 4: Campaign ID present and valid format
         campaign_id = campaign_data.get("campaign_id", "")
 
-        if not campaign_id or not re.match(r"^\d+$", str(campaign_id)):
-            findings.append({
-                "check": "campaign_id",
-                "category": "config_completeness",
-                "severity": "CRITICAL",
-                "message": f"Campaign ID missing or invalid: '{campaign_id}'",
-                "value": campaign_id,
-                "expected": "Non-empty string of digits",
-            })
+        if not campaign_id or not str(campaign_id).isdecimal():
+            findings.append(_finding(
+                "campaign_id", "config_completeness", Severity.CRITICAL,
+                f"Campaign ID missing or invalid: '{campaign_id}'",
+                value=campaign_id,
+                expected="Non-empty string of digits",
+            ))
         else:
-            findings.append({
-                "check": "campaign_id",
-                "category": "config_completeness",
-                "severity": "PASS",
-                "message": f"Campaign ID valid: {campaign_id}",
-                "value": campaign_id,
-                "expected": "Non-empty string of digits",
-            })
+            findings.append(_finding(
+                "campaign_id", "config_completeness", Severity.PASS,
+                f"Campaign ID valid: {campaign_id}",
+                value=campaign_id,
+                expected="Non-empty string of digits",
+            ))
 
         return findings
 
@@ -242,160 +455,94 @@ class CampaignAuditor:
         google_settings = campaign_data.get("google_ads_settings", {})
 
         if not google_settings:
-            findings.append({
-                "check": "google_ads_settings_missing",
-                "category": "google_ads_alignment",
-                "severity": "WARNING",
-                "message": "No Google Ads settings available — run sync_config first",
-                "value": None,
-                "expected": "Synced Google Ads settings",
-            })
+            findings.append(_finding(
+                "google_ads_settings_missing", "google_ads_alignment", Severity.WARNING,
+                "No Google Ads settings available — run sync_config first",
+                value=None,
+                expected="Synced Google Ads settings",
+            ))
             return findings
 
         # Check 5: Campaign status is ENABLED
         status = google_settings.get("campaign_status", "")
-        if status == "ENABLED":
-            findings.append({
-                "check": "campaign_status",
-                "category": "google_ads_alignment",
-                "severity": "PASS",
-                "message": "Campaign status is ENABLED",
-                "value": status,
-                "expected": "ENABLED",
-            })
-        else:
-            findings.append({
-                "check": "campaign_status",
-                "category": "google_ads_alignment",
-                "severity": "CRITICAL",
-                "message": f"Campaign status is {status} — not serving ads",
-                "value": status,
-                "expected": "ENABLED",
-            })
+        findings.append(_pass_fail(
+            "campaign_status", "google_ads_alignment", status == "ENABLED",
+            "Campaign status is ENABLED",
+            f"Campaign status is {status} — not serving ads",
+            value=status,
+            expected="ENABLED",
+            fail_severity=Severity.CRITICAL,
+        ))
 
         # Check 6: Bidding strategy is MAXIMIZE_CONVERSION_VALUE
         bidding = google_settings.get("bidding_strategy_type", "")
-        if bidding == "MAXIMIZE_CONVERSION_VALUE":
-            findings.append({
-                "check": "bidding_strategy",
-                "category": "google_ads_alignment",
-                "severity": "PASS",
-                "message": "Bidding strategy is MAXIMIZE_CONVERSION_VALUE",
-                "value": bidding,
-                "expected": "MAXIMIZE_CONVERSION_VALUE",
-            })
-        else:
-            findings.append({
-                "check": "bidding_strategy",
-                "category": "google_ads_alignment",
-                "severity": "WARNING",
-                "message": (
-                    f"Bidding strategy is {bidding} — expected "
-                    "MAXIMIZE_CONVERSION_VALUE for PMax with ROAS targets"
-                ),
-                "value": bidding,
-                "expected": "MAXIMIZE_CONVERSION_VALUE",
-            })
+        findings.append(_pass_fail(
+            "bidding_strategy", "google_ads_alignment", bidding == "MAXIMIZE_CONVERSION_VALUE",
+            "Bidding strategy is MAXIMIZE_CONVERSION_VALUE",
+            (
+                f"Bidding strategy is {bidding} — expected "
+                "MAXIMIZE_CONVERSION_VALUE for PMax with ROAS targets"
+            ),
+            value=bidding,
+            expected="MAXIMIZE_CONVERSION_VALUE",
+        ))
 
         # Check 7: Target ROAS is set and reasonable (100%-500%)
         target_roas = google_settings.get("target_roas")
         if target_roas is None:
-            findings.append({
-                "check": "target_roas",
-                "category": "google_ads_alignment",
-                "severity": "WARNING",
-                "message": "Target ROAS is not set",
-                "value": None,
-                "expected": "100% - 500%",
-            })
+            findings.append(_finding(
+                "target_roas", "google_ads_alignment", Severity.WARNING,
+                "Target ROAS is not set",
+                value=None,
+                expected="100% - 500%",
+            ))
         else:
             # Google Ads API returns target_roas as a ratio (2.0 = 200%)
             raw = float(target_roas)
             target_roas_pct = raw * 100 if raw < 10 else raw
-            if 100 <= target_roas_pct <= 500:
-                findings.append({
-                    "check": "target_roas",
-                    "category": "google_ads_alignment",
-                    "severity": "PASS",
-                    "message": f"Target ROAS is {target_roas_pct:.0f}%",
-                    "value": target_roas_pct,
-                    "expected": "100% - 500%",
-                })
-            else:
-                findings.append({
-                    "check": "target_roas",
-                    "category": "google_ads_alignment",
-                    "severity": "WARNING",
-                    "message": f"Target ROAS {target_roas_pct:.0f}% is outside reasonable range (100%-500%)",
-                    "value": target_roas_pct,
-                    "expected": "100% - 500%",
-                })
+            findings.append(_pass_fail(
+                "target_roas", "google_ads_alignment", 100 <= target_roas_pct <= 500,
+                f"Target ROAS is {target_roas_pct:.0f}%",
+                f"Target ROAS {target_roas_pct:.0f}% is outside reasonable range (100%-500%)",
+                value=target_roas_pct,
+                expected="100% - 500%",
+            ))
 
         # Check 8: Budget exceeds seasonal minimum
         daily_budget = float(google_settings.get("daily_budget", 0))
-        recommended = self.seasonal_budget["recommended_daily"]
-
-        if daily_budget >= recommended:
-            findings.append({
-                "check": "budget_minimum",
-                "category": "google_ads_alignment",
-                "severity": "PASS",
-                "message": f"Daily budget ${daily_budget:.0f} meets {self.season} minimum ${recommended:.0f}",
-                "value": daily_budget,
-                "expected": f">= ${recommended:.0f}",
-            })
-        else:
-            findings.append({
-                "check": "budget_minimum",
-                "category": "google_ads_alignment",
-                "severity": "WARNING",
-                "message": f"Daily budget ${daily_budget:.0f} is below {self.season} recommended ${recommended:.0f}",
-                "value": daily_budget,
-                "expected": f">= ${recommended:.0f}",
-            })
+        season = self.season
+        seasonal_budget = self.seasonal_budget
+        recommended = seasonal_budget["recommended_daily"]
+        max_daily = seasonal_budget["max_daily"]
+
+        findings.append(_pass_fail(
+            "budget_minimum", "google_ads_alignment", daily_budget >= recommended,
+            f"Daily budget ${daily_budget:.0f} meets {season} minimum ${recommended:.0f}",
+            f"Daily budget ${daily_budget:.0f} is below {season} recommended ${recommended:.0f}",
+            value=daily_budget,
+            expected=f">= ${recommended:.0f}",
+        ))
 
         # Check 9: Budget doesn't exceed seasonal max
-        max_daily = self.seasonal_budget["max_daily"]
-
-        if daily_budget <= max_daily:
-            findings.append({
-                "check": "budget_maximum",
-                "category": "google_ads_alignment",
-                "severity": "PASS",
-                "message": f"Daily budget ${daily_budget:.0f} within {self.season} max ${max_daily:.0f}",
-                "value": daily_budget,
-                "expected": f"<= ${max_daily:.0f}",
-            })
-        else:
-            findings.append({
-                "check": "budget_maximum",
-                "category": "google_ads_alignment",
-                "severity": "INFO",
-                "message": f"Daily budget ${daily_budget:.0f} exceeds {self.season} max ${max_daily:.0f}",
-                "value": daily_budget,
-                "expected": f"<= ${max_daily:.0f}",
-            })
+        findings.append(_pass_fail(
+            "budget_maximum", "google_ads_alignment", daily_budget <= max_daily,
+            f"Daily budget ${daily_budget:.0f} within {season} max ${max_daily:.0f}",
+            f"Daily budget ${daily_budget:.0f} exceeds {season} max ${max_daily:.0f}",
+            value=daily_budget,
+            expected=f"<= ${max_daily:.0f}",
+            fail_severity=Severity.INFO,
+        ))
 
         # Check 10: Geo targeting is configured
         geo_targets = google_settings.get("geo_targets", [])
-        if geo_targets:
-            findings.append({
-                "check": "geo_targeting",
-                "category": "google_ads_alignment",
-                "severity": "PASS",
-                "message": f"Geo targeting configured ({len(geo_targets)} target(s))",
-                "value": len(geo_targets),
-                "expected": ">= 1 target",
-            })
-        else:
-            findings.append({
-                "check": "geo_targeting",
-                "category": "google_ads_alignment",
-                "severity": "WARNING",
-                "message": "No geo targeting configured — campaign may serve globally",
-                "value": 0,
-                "expected": ">= 1 target",
-            })
+        geo_count = len(geo_targets) if geo_targets else 0
+        findings.append(_pass_fail(
+            "geo_targeting", "google_ads_alignment", geo_count > 0,
+            f"Geo targeting configured ({geo_count} target(s))",
+            "No geo targeting configured — campaign may serve globally",
+            value=geo_count,
+            expected=">= 1 target",
+        ))
 
         return findings
 
@@ -405,33 +552,40 @@ class CampaignAuditor:
         findings = []
 
         try:
-            history = get_budget_history(campaign_name, weeks=8)
+            history = self._cached_budget_history(campaign_name, weeks=8)
         except Exception as e:
             logger.warning("Could not load budget history for %s: %s", campaign_name, e)
-            findings.append({
-                "check": "budget_history_unavailable",
-                "category": "performance_trends",
-                "severity": "WARNING",
-                "message": f"Could not load budget history: {e}",
-                "value": None,
-                "expected": "Budget history available",
-            })
+            findings.append(_finding(
+                "budget_history_unavailable", "performance_trends", Severity.WARNING,
+                f"Could not load budget history: {e}",
+                value=None,
+                expected="Budget history available",
+            ))
             return findings
 
         if not history:
-            findings.append({
-                "check": "budget_history_empty",
-                "category": "performance_trends",
-                "severity": "INFO",
-                "message": "No budget history data available yet",
-                "value": 0,
-                "expected": ">= 1 week of data",
-            })
+            findings.append(_finding(
+                "budget_history_empty", "performance_trends", Severity.INFO,
+                "No budget history data available yet",
+                value=0,
+                expected=">= 1 week of data",
+            ))
             return findings
 
+        # Convert the 4-week trend window to float series once
+        # (history is sorted descending: [newest, ..., oldest])
+        window = history[:4]
+        roas_series = [float(w.get("roas_percent", 0)) for w in window]
+        spend_series = [float(w.get("total_spend", 0)) for w in window]
+        util_series = [float(w.get("budget_utilization_percent", 0)) for w in window]
+
+        declining_count, max_swing, low_util_weeks, latest_util = _trend_stats(
+            roas_series, spend_series, util_series
+        )
+
         # Check 11: ROAS vs seasonal target
         latest = history[0]  # Most recent (sorted descending)
-        roas = float(latest.get("roas_percent", 0))
+        roas = roas_series[0]
         target_roas = float(latest.get("target_roas_percent", 0))
         seasonal_target = self.seasonal_budget["target_roas"]
 
@@ -442,153 +596,105 @@ class CampaignAuditor:
             gap_pct = ((effective_target - roas) / effective_target) * 100
 
             if gap_pct > 30:
-                findings.append({
-                    "check": "roas_vs_target",
-                    "category": "performance_trends",
-                    "severity": "CRITICAL",
-                    "message": f"ROAS {roas:.0f}% is {gap_pct:.0f}% below target {effective_target:.0f}%",
-                    "value": roas,
-                    "expected": f">= {effective_target:.0f}%",
-                })
+                findings.append(_finding(
+                    "roas_vs_target", "performance_trends", Severity.CRITICAL,
+                    f"ROAS {roas:.0f}% is {gap_pct:.0f}% below target {effective_target:.0f}%",
+                    value=roas,
+                    expected=f">= {effective_target:.0f}%",
+                ))
             elif gap_pct > 10:
-                findings.append({
-                    "check": "roas_vs_target",
-                    "category": "performance_trends",
-                    "severity": "WARNING",
-                    "message": f"ROAS {roas:.0f}% is {gap_pct:.0f}% below target {effective_target:.0f}%",
-                    "value": roas,
-                    "expected": f">= {effective_target:.0f}%",
-                })
+                findings.append(_finding(
+                    "roas_vs_target", "performance_trends", Severity.WARNING,
+                    f"ROAS {roas:.0f}% is {gap_pct:.0f}% below target {effective_target:.0f}%",
+                    value=roas,
+                    expected=f">= {effective_target:.0f}%",
+                ))
             else:
-                findings.append({
-                    "check": "roas_vs_target",
-                    "category": "performance_trends",
-                    "severity": "PASS",
-                    "message": f"ROAS {roas:.0f}% is on target ({effective_target:.0f}%)",
-                    "value": roas,
-                    "expected": f">= {effective_target:.0f}%",
-                })
+                findings.append(_finding(
+                    "roas_vs_target", "performance_trends", Severity.PASS,
+                    f"ROAS {roas:.0f}% is on target ({effective_target:.0f}%)",
+                    value=roas,
+                    expected=f">= {effective_target:.0f}%",
+                ))
         else:
-            findings.append({
-                "check": "roas_vs_target",
-                "category": "performance_trends",
-                "severity": "INFO",
-                "message": "Insufficient ROAS data for comparison",
-                "value": roas,
-                "expected": "ROAS and target data available",
-            })
+            findings.append(_finding(
+                "roas_vs_target", "performance_trends", Severity.INFO,
+                "Insufficient ROAS data for comparison",
+                value=roas,
+                expected="ROAS and target data available",
+            ))
 
         # Check 12: ROAS trend direction (declining 3+ consecutive weeks)
         if len(history) >= 4:
-            # history is sorted descending: [newest, ..., oldest]
-            last_4_roas = [float(w.get("roas_percent", 0)) for w in history[:4]]
-            declining_count = 0
-            for i in range(len(last_4_roas) - 1):
-                if last_4_roas[i] < last_4_roas[i + 1]:
-                    declining_count += 1
-                else:
-                    break
+            last_4_roas = roas_series
 
             # Display oldest-to-newest for readability
             trend_display = " -> ".join(f"{r:.0f}%" for r in reversed(last_4_roas))
 
             if declining_count >= 3:
-                findings.append({
-                    "check": "roas_trend",
-                    "category": "performance_trends",
-                    "severity": "WARNING",
-                    "message": f"ROAS declining {declining_count} consecutive weeks: {trend_display}",
-                    "value": last_4_roas,
-                    "expected": "Stable or improving trend",
-                })
+                findings.append(_finding(
+                    "roas_trend", "performance_trends", Severity.WARNING,
+                    f"ROAS declining {declining_count} consecutive weeks: {trend_display}",
+                    value=last_4_roas,
+                    expected="Stable or improving trend",
+                ))
             else:
-                findings.append({
-                    "check": "roas_trend",
-                    "category": "performance_trends",
-                    "severity": "PASS",
-                    "message": f"ROAS trend stable: {trend_display}",
-                    "value": last_4_roas,
-                    "expected": "Stable or improving trend",
-                })
+                findings.append(_finding(
+                    "roas_trend", "performance_trends", Severity.PASS,
+                    f"ROAS trend stable: {trend_display}",
+                    value=last_4_roas,
+                    expected="Stable or improving trend",
+                ))
         else:
-            findings.append({
-                "check": "roas_trend",
-                "category": "performance_trends",
-                "severity": "INFO",
-                "message": f"Only {len(history)} week(s) of data — need 4 for trend analysis",
-                "value": len(history),
-                "expected": ">= 4 weeks of data",
-            })
+            findings.append(_finding(
+                "roas_trend", "performance_trends", Severity.INFO,
+                f"Only {len(history)} week(s) of data — need 4 for trend analysis",
+                value=len(history),
+                expected=">= 4 weeks of data",
+            ))
 
         # Check 13: Budget utilization healthy (not <50% for 2+ consecutive weeks)
-        low_util_weeks = 0
-        for week in history[:4]:
-            util = float(week.get("budget_utilization_percent", 0))
-            if util < 50:
-                low_util_weeks += 1
-            else:
-                break
-
-        latest_util = float(history[0].get("budget_utilization_percent", 0))
-
         if low_util_weeks >= 2:
-            findings.append({
-                "check": "budget_utilization",
-                "category": "performance_trends",
-                "severity": "WARNING",
-                "message": (
+            findings.append(_finding(
+                "budget_utilization", "performance_trends", Severity.WARNING,
+                (
                     f"Budget utilization below 50% for {low_util_weeks} consecutive "
                     f"weeks (latest: {latest_util:.0f}%)"
                 ),
-                "value": latest_util,
-                "expected": ">= 50% utilization",
-            })
+                value=latest_util,
+                expected=">= 50% utilization",
+            ))
         else:
-            findings.append({
-                "check": "budget_utilization",
-                "category": "performance_trends",
-                "severity": "PASS",
-                "message": f"Budget utilization healthy at {latest_util:.0f}%",
-                "value": latest_util,
-                "expected": ">= 50% utilization",
-            })
+            findings.append(_finding(
+                "budget_utilization", "performance_trends", Severity.PASS,
+                f"Budget utilization healthy at {latest_util:.0f}%",
+                value=latest_util,
+                expected=">= 50% utilization",
+            ))
 
         # Check 14: Spend volatility (>40% week-to-week swing)
         if len(history) >= 2:
-            spends = [float(w.get("total_spend", 0)) for w in history[:4]]
-            max_swing = 0
-            for i in range(len(spends) - 1):
-                if spends[i + 1] > 0:
-                    swing = abs(spends[i] - spends[i + 1]) / spends[i + 1] * 100
-                    max_swing = max(max_swing, swing)
-
             if max_swing > 40:
-                findings.append({
-                    "check": "spend_volatility",
-                    "category": "performance_trends",
-                    "severity": "INFO",
-                    "message": f"Spend volatility {max_swing:.0f}% — large week-to-week swings suggest instability",
-                    "value": max_swing,
-                    "expected": "<= 40% swing",
-                })
+                findings.append(_finding(
+                    "spend_volatility", "performance_trends", Severity.INFO,
+                    f"Spend volatility {max_swing:.0f}% — large week-to-week swings suggest instability",
+                    value=max_swing,
+                    expected="<= 40% swing",
+                ))
             else:
-                findings.append({
-                    "check": "spend_volatility",
-                    "category": "performance_trends",
-                    "severity": "PASS",
-                    "message": f"Spend volatility {max_swing:.0f}% within normal range",
-                    "value": max_swing,
-                    "expected": "<= 40% swing",
-                })
+                findings.append(_finding(
+                    "spend_volatility", "performance_trends", Severity.PASS,
+                    f"Spend volatility {max_swing:.0f}% within normal range",
+                    value=max_swing,
+                    expected="<= 40% swing",
+                ))
         else:
-            findings.append({
-                "check": "spend_volatility",
-                "category": "performance_trends",
-                "severity": "INFO",
-                "message": "Not enough data for volatility analysis",
-                "value": None,
-                "expected": ">= 2 weeks of data",
-            })
+            findings.append(_finding(
+                "spend_volatility", "performance_trends", Severity.INFO,
+                "Not enough data for volatility analysis",
+                value=None,
+                expected=">= 2 weeks of data",
+            ))
 
         return findings
 
@@ -598,24 +704,42 @@ class CampaignAuditor:
         findings = []
 
         try:
-            assets = get_latest_asset_records(campaign_name)
+            assets = self._asset_records(campaign_name)
         except Exception as e:
             logger.warning("Could not load assets for %s: %s", campaign_name, e)
-            return [{
-                "check": "asset_data_unavailable",
-                "category": "asset_health",
-                "severity": "WARNING",
-                "message": f"Could not load asset data: {e}",
-                "value": None,
-                "expected": "Asset data available",
-            }]
+            return [_finding(
+                "asset_data_unavailable", "asset_health", Severity.WARNING,
+                f"Could not load asset data: {e}",
+                value=None,
+                expected="Asset data available",
+            )]
+
+        # One pass over active assets: group by type (check 15) and find the oldest (check 17)
+        active_by_type = defaultdict(list)
+        total_active = 0
+        oldest_days = 0
+        oldest_asset_type = None
+        for asset in assets:
+            if asset.get("status") != "active":
+                continue
+            total_active += 1
+            active_by_type[asset.get("asset_type")].append(asset)
 
-        active_assets = [a for a in assets if a.get("status") == "active"]
+            date_added = asset.get("date_added") or asset.get("created_at", "")
+            if date_added:
+                try:
+                    added_dt = datetime.fromisoformat(date_added)
+                    age_days = self._elapsed_since(added_dt).days
+                    if age_days > oldest_days:
+                        oldest_days = age_days
+                        oldest_asset_type = asset.get("asset_type", "asset")
+                except (ValueError, TypeError):
+                    pass
 
         # Check 15: Text asset minimums met (PMax requires >=3 headlines, >=2 descriptions, >=1 long headline)
-        headlines = [a for a in active_assets if a.get("asset_type") == "HEADLINE"]
-        long_headlines = [a for a in active_assets if a.get("asset_type") == "LONG_HEADLINE"]
-        descriptions = [a for a in active_assets if a.get("asset_type") == "DESCRIPTION"]
+        headlines = active_by_type["HEADLINE"]
+        long_headlines = active_by_type["LONG_HEADLINE"]
+        descriptions = active_by_type["DESCRIPTION"]
 
         missing = []
         if len(headlines) < 3:
@@ -626,42 +750,40 @@ class CampaignAuditor:
             missing.append(f"long headlines ({len(long_headlines)}/1)")
 
         if missing:
-            findings.append({
-                "check": "text_asset_minimums",
-                "category": "asset_health",
-                "severity": "CRITICAL",
-                "message": f"Below PMax minimums: {', '.join(missing)}",
-                "value": {
+            findings.append(_finding(
+                "text_asset_minimums", "asset_health", Severity.CRITICAL,
+                f"Below PMax minimums: {', '.join(missing)}",
+                value={
                     "headlines": len(headlines),
                     "descriptions": len(descriptions),
                     "long_headlines": len(long_headlines),
                 },
-                "expected": {"headlines": ">= 3", "descriptions": ">= 2", "long_headlines": ">= 1"},
-            })
+                expected={"headlines": ">= 3", "descriptions": ">= 2", "long_headlines": ">= 1"},
+            ))
         else:
-            findings.append({
-                "check": "text_asset_minimums",
-                "category": "asset_health",
-                "severity": "PASS",
-                "message": (
+            findings.append(_finding(
+                "text_asset_minimums", "asset_health", Severity.PASS,
+                (
                     f"Text asset minimums met: {len(headlines)} headlines, "
                     f"{len(descriptions)} descriptions, {len(long_headlines)} long headlines"
                 ),
-                "value": {
+                value={
                     "headlines": len(headlines),
                     "descriptions": len(descriptions),
                     "long_headlines": len(long_headlines),
                 },
-                "expected": {"headlines": ">= 3", "descriptions": ">= 2", "long_headlines": ">= 1"},
-            })
+                expected={"headlines": ">= 3", "descriptions": ">= 2", "long_headlines": ">= 1"},
+            ))
 
         # Check 16: Image format coverage (at least 1 landscape, 1 square, 1 portrait)
         try:
-            images = get_images_for_campaign(campaign_name)
+            images = self._campaign_images(campaign_name)
         except Exception as e:
             logger.warning("Could not load images for %s: %s", campaign_name, e)
             images = []
 
+        # Stop scanning as soon as every required format has been seen
+        required_formats = REQUIRED_IMAGE_FORMATS
         formats_present = set()
         for image in images:
             for mapping in image.get("google_ads_assets", []):
@@ -670,117 +792,88 @@ class CampaignAuditor:
                     and not mapping.get("date_unlinked")
                 ):
                     ft = mapping.get("field_type", "")
-                    if ft:
+                    if ft in required_formats:
                         formats_present.add(ft)
+            if formats_present >= required_formats:
+                break
 
-        required_formats = {"MARKETING_IMAGE", "SQUARE_MARKETING_IMAGE", "PORTRAIT_MARKETING_IMAGE"}
         missing_formats = required_formats - formats_present
 
         if missing_formats:
             friendly = [f.replace("_", " ").lower() for f in sorted(missing_formats)]
-            findings.append({
-                "check": "image_format_coverage",
-                "category": "asset_health",
-                "severity": "CRITICAL",
-                "message": f"Missing image formats: {', '.join(friendly)} — PMax cannot optimize all placements",
-                "value": sorted(formats_present),
-                "expected": sorted(required_formats),
-            })
+            findings.append(_finding(
+                "image_format_coverage", "asset_health", Severity.CRITICAL,
+                f"Missing image formats: {', '.join(friendly)} — PMax cannot optimize all placements",
+                value=sorted(formats_present),
+                expected=_REQUIRED_IMAGE_FORMATS_SORTED,
+            ))
         else:
-            findings.append({
-                "check": "image_format_coverage",
-                "category": "asset_health",
-                "severity": "PASS",
-                "message": "All image formats present (landscape, square, portrait)",
-                "value": sorted(formats_present),
-                "expected": sorted(required_formats),
-            })
+            findings.append(_finding(
+                "image_format_coverage", "asset_health", Severity.PASS,
+                "All image formats present (landscape, square, portrait)",
+                value=_REQUIRED_IMAGE_FORMATS_SORTED,
+                expected=_REQUIRED_IMAGE_FORMATS_SORTED,
+            ))
 
         # Check 17: Asset freshness (oldest active asset >180 days)
-        oldest_days = 0
-        oldest_asset_type = None
-        for asset in active_assets:
-            date_added = asset.get("date_added") or asset.get("created_at", "")
-            if date_added:
-                try:
-                    added_dt = datetime.fromisoformat(date_added.replace("Z", "+00:00"))
-                    now = datetime.utcnow().replace(tzinfo=added_dt.tzinfo)
-                    age_days = (now - added_dt).days
-                    if age_days > oldest_days:
-                        oldest_days = age_days
-                        oldest_asset_type = asset.get("asset_type", "asset")
-                except (ValueError, TypeError):
-                    pass
-
         if oldest_days > 180:
-            findings.append({
-                "check": "asset_freshness",
-                "category": "asset_health",
-                "severity": "WARNING",
-                "message": (
+            findings.append(_finding(
+                "asset_freshness", "asset_health", Severity.WARNING,
+                (
                     f"Oldest active {oldest_asset_type.lower() if oldest_asset_type else 'asset'} "
                     f"is {oldest_days} days old — consider refreshing"
                 ),
-                "value": oldest_days,
-                "expected": "<= 180 days",
-            })
+                value=oldest_days,
+                expected="<= 180 days",
+            ))
         else:
-            findings.append({
-                "check": "asset_freshness",
-                "category": "asset_health",
-                "severity": "PASS",
-                "message": f"All assets under 180 days old (oldest: {oldest_days} days)",
-                "value": oldest_days,
-                "expected": "<= 180 days",
-            })
+            findings.append(_finding(
+                "asset_freshness", "asset_health", Severity.PASS,
+                f"All assets under 180 days old (oldest: {oldest_days} days)",
+                value=oldest_days,
+                expected="<= 180 days",
+            ))
 
         # Check 18: Kill rate not excessive (>40% killed in last 60 days)
         try:
-            graveyard = get_graveyard_assets(campaign_name)
+            graveyard = self._cached_graveyard(campaign_name)
         except Exception as e:
             logger.warning("Could not load graveyard for %s: %s", campaign_name, e)
             graveyard = []
 
-        cutoff = (datetime.utcnow() - timedelta(days=60)).strftime("%Y-%m-%d")
-        recent_kills = [a for a in graveyard if a.get("date_killed", "") >= cutoff]
-        total_active = len(active_assets)
-        total_pool = total_active + len(recent_kills)
+        cutoff = (self._now_utc - timedelta(days=60)).strftime("%Y-%m-%d")
+        recent_kill_count = sum(1 for a in graveyard if a.get("date_killed", "") >= cutoff)
+        total_pool = total_active + recent_kill_count
 
         if total_pool > 0:
-            kill_rate = len(recent_kills) / total_pool * 100
+            kill_rate = recent_kill_count / total_pool * 100
             if kill_rate > 40:
-                findings.append({
-                    "check": "kill_rate",
-                    "category": "asset_health",
-                    "severity": "WARNING",
-                    "message": (
+                findings.append(_finding(
+                    "kill_rate", "asset_health", Severity.WARNING,
+                    (
                         f"Kill rate {kill_rate:.0f}% in last 60 days "
-                        f"({len(recent_kills)} killed of {total_pool} total) — systemic issue possible"
+                        f"({recent_kill_count} killed of {total_pool} total) — systemic issue possible"
                     ),
-                    "value": kill_rate,
-                    "expected": "<= 40%",
-                })
+                    value=kill_rate,
+                    expected="<= 40%",
+                ))
             else:
-                findings.append({
-                    "check": "kill_rate",
-                    "category": "asset_health",
-                    "severity": "PASS",
-                    "message": (
+                findings.append(_finding(
+                    "kill_rate", "asset_health", Severity.PASS,
+                    (
                         f"Kill rate {kill_rate:.0f}% in last 60 days "
-                        f"({len(recent_kills)} killed of {total_pool} total)"
+                        f"({recent_kill_count} killed of {total_pool} total)"
                     ),
-                    "value": kill_rate,
-                    "expected": "<= 40%",
-                })
+                    value=kill_rate,
+                    expected="<= 40%",
+                ))
         else:
-            findings.append({
-                "check": "kill_rate",
-                "category": "asset_health",
-                "severity": "PASS",
-                "message": "No asset turnover data available",
-                "value": 0,
-                "expected": "<= 40%",
-            })
+            findings.append(_finding(
+                "kill_rate", "asset_health", Severity.PASS,
+                "No asset turnover data available",
+                value=0,
+                expected="<= 40%",
+            ))
 
         return findings
 
@@ -793,64 +886,55 @@ class CampaignAuditor:
 
         image_profile = campaign_data.get("image_profile", {})
         if not image_profile:
-            findings.append({
-                "check": "image_composition",
-                "category": "image_composition",
-                "severity": "INFO",
-                "message": "No image profile defined — skipping composition checks",
-                "value": None,
-                "expected": "Image profile defined",
-            })
+            findings.append(_finding(
+                "image_composition", "image_composition", Severity.INFO,
+                "No image profile defined — skipping composition checks",
+                value=None,
+                expected="Image profile defined",
+            ))
             return findings
 
         try:
-            all_images = get_images_for_campaign(campaign_name)
+            all_images = self._campaign_images(campaign_name)
             images = _dedupe_campaign_images(all_images, campaign_name)
         except Exception as e:
             logger.warning("Could not load images for %s: %s", campaign_name, e)
-            return [{
-                "check": "image_data_unavailable",
-                "category": "image_composition",
-                "severity": "WARNING",
-                "message": f"Could not load image data: {e}",
-                "value": None,
-                "expected": "Image data available",
-            }]
+            return [_finding(
+                "image_data_unavailable", "image_composition", Severity.WARNING,
+                f"Could not load image data: {e}",
+                value=None,
+                expected="Image data available",
+            )]
 
         total = len(images)
 
         # Check 20: Total image count adequate (need 10+ for PMax variety)
         if total < 10:
-            findings.append({
-                "check": "image_count",
-                "category": "image_composition",
-                "severity": "WARNING",
-                "message": f"Only {total} images — PMax needs visual variety (recommend 10+)",
-                "value": total,
-                "expected": ">= 10",
-            })
+            findings.append(_finding(
+                "image_count", "image_composition", Severity.WARNING,
+                f"Only {total} images — PMax needs visual variety (recommend 10+)",
+                value=total,
+                expected=">= 10",
+            ))
         else:
-            findings.append({
-                "check": "image_count",
-                "category": "image_composition",
-                "severity": "PASS",
-                "message": f"{total} images in asset group",
-                "value": total,
-                "expected": ">= 10",
-            })
+            findings.append(_finding(
+                "image_count", "image_composition", Severity.PASS,
+                f"{total} images in asset group",
+                value=total,
+                expected=">= 10",
+            ))
 
         # Check 19: No category >15% underrepresented
         if total > 0:
-            category_counts = {cat: 0 for cat in CONTENT_CATEGORIES}
-            for image in images:
-                cat = image.get("content_category", "")
-                if cat in category_counts:
-                    category_counts[cat] += 1
+            counts = Counter(image.get("content_category", "") for image in images)
+            category_counts = {cat: counts[cat] for cat in CONTENT_CATEGORIES}
 
             underrepresented = []
             for category in CONTENT_CATEGORIES:
-                actual_pct = category_counts[category] / total * 100
                 target_pct = float(image_profile.get(category, 0)) * 100
+                if target_pct <= 15:
+                    continue  # Can't be >15 points under a target this small
+                actual_pct = category_counts[category] / total * 100
                 delta = target_pct - actual_pct
 
                 if delta > 15:
@@ -864,35 +948,29 @@ class CampaignAuditor:
             if underrepresented:
                 for gap in underrepresented:
                     cat_name = gap["category"].replace("_", " ")
-                    findings.append({
-                        "check": "image_category_gap",
-                        "category": "image_composition",
-                        "severity": "WARNING",
-                        "message": (
+                    findings.append(_finding(
+                        "image_category_gap", "image_composition", Severity.WARNING,
+                        (
                             f"{cat_name} is {gap['delta']:.0f}% underrepresented "
                             f"({gap['actual_pct']:.0f}% actual vs {gap['target_pct']:.0f}% target)"
                         ),
-                        "value": gap["actual_pct"],
-                        "expected": f"{gap['target_pct']:.0f}% (+/- 15%)",
-                    })
+                        value=gap["actual_pct"],
+                        expected=f"{gap['target_pct']:.0f}% (+/- 15%)",
+                    ))
             else:
-                findings.append({
-                    "check": "image_category_gap",
-                    "category": "image_composition",
-                    "severity": "PASS",
-                    "message": "Image composition within targets (no category >15% underrepresented)",
-                    "value": category_counts,
-                    "expected": "All categories within 15% of target",
-                })
+                findings.append(_finding(
+                    "image_category_gap", "image_composition", Severity.PASS,
+                    "Image composition within targets (no category >15% underrepresented)",
+                    value=category_counts,
+                    expected="All categories within 15% of target",
+                ))
         else:
-            findings.append({
-                "check": "image_category_gap",
-                "category": "image_composition",
-                "severity": "INFO",
-                "message": "No images to analyze composition",
-                "value": 0,
-                "expected": "Images available for composition analysis",
-            })
+            findings.append(_finding(
+                "image_category_gap", "image_composition", Severity.INFO,
+                "No images to analyze composition",
+                value=0,
+                expected="Images available for composition analysis",
+            ))
 
         return findings
 
@@ -900,17 +978,10 @@ class CampaignAuditor:
 
     def _calculate_score(self, findings: List[Dict[str, Any]]) -> Tuple[int, str]:
         """Calculate health score (0-100) and letter grade from findings."""
-        score = 100
-        for finding in findings:
-            score -= SEVERITY_DEDUCTIONS.get(finding["severity"], 0)
-
-        score = max(0, score)
+        deduction = SEVERITY_DEDUCTIONS.get
+        score = max(0, 100 - sum(deduction(finding["severity"], 0) for finding in findings))
 
-        grade = "F"
-        for threshold, letter in GRADE_SCALE:
-            if score >= threshold:
-                grade = letter
-                break
+        grade = _GRADE_LETTERS[bisect.bisect_right(_GRADE_CUTS, score) - 1]
 
         return score, grade
 
@@ -923,6 +994,12 @@ class CampaignAuditor:
         if not self.anthropic_key:
             return self._fallback_summary(all_findings, campaign_results)
 
+        # Nothing for Claude to prioritize when every check passed or is informational
+        if not any(
+            f["severity"] in (Severity.CRITICAL, Severity.WARNING) for f in all_findings
+        ):
+            return self._fallback_summary(all_findings, campaign_results)
+
         # Build concise findings for the prompt (exclude PASS)
         findings_for_prompt = []
         for campaign_name, result in campaign_results.items():
@@ -937,49 +1014,39 @@ class CampaignAuditor:
                         "message": f["message"],
                     }
                     for f in result["findings"]
-                    if f["severity"] != "PASS"
+                    if f["severity"] != Severity.PASS
                 ],
             })
 
+        # Compact separators: cheaper to encode and fewer prompt tokens than indent=2
         prompt = AUDIT_SUMMARY_PROMPT.format(
-            findings_json=json.dumps(findings_for_prompt, indent=2, default=str),
+            findings_json=json.dumps(findings_for_prompt, separators=(",", ":"), default=str),
         )
 
         try:
-            response = requests.post(
-                "https://api.anthropic.com/v1/messages",
-                headers={
-                    "x-api-key": self.anthropic_key,
-                    "anthropic-version": "2023-06-01",
-                    "content-type": "application/json",
-                },
-                json={
-                    "model": "claude-sonnet-4-5-20250929",
-                    "max_tokens": 1024,
-                    "messages": [
-                        {"role": "user", "content": prompt},
-                    ],
-                },
+            response = self.client.messages.create(
+                model="claude-sonnet-4-5-20250929",
+                max_tokens=1024,
+                messages=[
+                    {"role": "user", "content": prompt},
+                ],
+                tools=[AUDIT_SUMMARY_TOOL],
+                tool_choice={"type": "tool", "name": AUDIT_SUMMARY_TOOL["name"]},
             )
 
-            if not response.ok:
-                logger.warning(
-                    "Claude API error for audit summary: %d — %s",
-                    response.status_code, response.text[:300],
-                )
-                return self._fallback_summary(all_findings, campaign_results)
-
-            result = response.json()
-            text = result["content"][0]["text"].strip()
-            if text.startswith("```"):
-                text = text.split("\n", 1)[1].rsplit("```", 1)[0].strip()
-
-            summary_data = json.loads(text)
+            summary_data = _extract_summary(response.content)
             return {
                 "summary": summary_data.get("summary", ""),
                 "recommendations": summary_data.get("recommendations", []),
             }
 
+        except anthropic.APIStatusError as e:
+            logger.warning(
+                "Claude API error for audit summary: %d — %s",
+                e.status_code, str(e)[:300],
+            )
+            return self._fallback_summary(all_findings, campaign_results)
+
         except Exception as e:
             logger.warning("Failed to generate Claude summary: %s", e)
             return self._fallback_summary(all_findings, campaign_results)
@@ -988,8 +1055,9 @@ class CampaignAuditor:
         self, all_findings: List[Dict[str, Any]], campaign_results: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Generate basic summary when Claude API is unavailable."""
-        critical = [f for f in all_findings if f["severity"] == "CRITICAL"]
-        warnings = [f for f in all_findings if f["severity"] == "WARNING"]
+        by_severity = _group_by_severity(all_findings)
+        critical = by_severity[Severity.CRITICAL]
+        warnings = by_severity[Severity.WARNING]
 
         parts = []
         for name, result in campaign_results.items():
@@ -1027,10 +1095,11 @@ class CampaignAuditor:
             grade = result["grade"]
             findings = result["findings"]
 
-            passed = [f for f in findings if f["severity"] == "PASS"]
-            warnings = [f for f in findings if f["severity"] == "WARNING"]
-            criticals = [f for f in findings if f["severity"] == "CRITICAL"]
-            infos = [f for f in findings if f["severity"] == "INFO"]
+            by_severity = _group_by_severity(findings)
+            passed = by_severity[Severity.PASS]
+            warnings = by_severity[Severity.WARNING]
+            criticals = by_severity[Severity.CRITICAL]
+            infos = by_severity[Severity.INFO]
 
             lines.append("")
             lines.append(f"\U0001f3e5 *{campaign_name} \u2014 Score: {score}/100 ({grade})*")
@@ -7,8 +7,9 @@ and image profiles into a single config file.
 
 import json
 import logging
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple
 
 import boto3
 
@@ -20,6 +21,19 @@ logger = logging.getLogger("rising-pmax.campaign-config")
 S3_CONFIG_KEY = "config/campaigns.json"
 SCHEMA_VERSION = 1
 STALE_THRESHOLD_HOURS = 24
+# How long a warm Lambda reuses the last config JSON before re-reading S3
+CONFIG_CACHE_TTL_SECONDS = 60
+
+_s3_client: Optional[boto3.client] = None
+# (monotonic fetch time, raw config JSON); parsed per call so callers can mutate freely
+_config_cache: Optional[Tuple[float, str]] = None
+
+
+def _get_s3_client():
+    global _s3_client
+    if _s3_client is None:
+        _s3_client = boto3.client("s3")
+    return _s3_client
 
 
 def load_config() -> Dict[str, Any]:
@@ -28,10 +42,16 @@ def load_config() -> Dict[str, Any]:
     Falls back to building initial config from settings.py if the
     S3 file doesn't exist yet.
     """
-    s3 = boto3.client("s3")
+    global _config_cache
+    if _config_cache is not None and time.monotonic() - _config_cache[0] < CONFIG_CACHE_TTL_SECONDS:
+        return json.loads(_config_cache[1])
+
+    s3 = _get_s3_client()
     try:
         response = s3.get_object(Bucket=S3_IMAGE_BUCKET, Key=S3_CONFIG_KEY)
-        config = json.loads(response["Body"].read().decode("utf-8"))
+        body = response["Body"].read().decode("utf-8")
+        config = json.loads(body)
+        _config_cache = (time.monotonic(), body)
         logger.info("Loaded campaign config from s3://%s/%s", S3_IMAGE_BUCKET, S3_CONFIG_KEY)
         return config
     except s3.exceptions.NoSuchKey:
@@ -44,7 +64,8 @@ def load_config() -> Dict[str, Any]:
 
 def save_config(config: Dict[str, Any]) -> None:
     """Write campaign config JSON to S3."""
-    s3 = boto3.client("s3")
+    global _config_cache
+    s3 = _get_s3_client()
     config["last_synced_at"] = datetime.utcnow().isoformat() + "Z"
     body = json.dumps(config, indent=2, default=str)
     s3.put_object(
@@ -53,6 +74,7 @@ def save_config(config: Dict[str, Any]) -> None:
         Body=body.encode("utf-8"),
         ContentType="application/json",
     )
+    _config_cache = (time.monotonic(), body)
     logger.info("Saved campaign config to s3://%s/%s", S3_IMAGE_BUCKET, S3_CONFIG_KEY)
 
 
@@ -62,18 +84,26 @@ def sync_google_ads_settings(config: Dict[str, Any], collector) -> Dict[str, Any
     Only overwrites the google_ads_settings section — manual and
     image_profile sections are preserved.
     """
+    campaigns = {}
     for campaign_name, campaign_data in config.get("campaigns", {}).items():
         campaign_id = campaign_data.get("campaign_id")
         if not campaign_id:
             logger.warning("No campaign_id for '%s', skipping sync", campaign_name)
             continue
+        campaigns[campaign_name] = campaign_id
+
+    if not campaigns:
+        return config
+
+    try:
+        settings_by_id = collector.get_campaign_settings_bulk(list(campaigns.values()))
+    except Exception as e:
+        logger.error("Failed to sync settings for %s: %s", ", ".join(campaigns), e)
+        return config
 
-        try:
-            settings = collector.get_campaign_settings(campaign_id)
-            campaign_data["google_ads_settings"] = settings
-            logger.info("Synced Google Ads settings for '%s'", campaign_name)
-        except Exception as e:
-            logger.error("Failed to sync settings for '%s': %s", campaign_name, e)
+    for campaign_name, campaign_id in campaigns.items():
+        config["campaigns"][campaign_name]["google_ads_settings"] = settings_by_id[str(campaign_id)]
+        logger.info("Synced Google Ads settings for '%s'", campaign_name)
 
     return config
 
@@ -108,9 +138,10 @@ def is_stale(config: Dict[str, Any]) -> bool:
     if not last_synced:
         return True
     try:
-        synced_dt = datetime.fromisoformat(last_synced.replace("Z", "+00:00"))
-        now = datetime.utcnow().replace(tzinfo=synced_dt.tzinfo)
-        return (now - synced_dt) > timedelta(hours=STALE_THRESHOLD_HOURS)
+        synced_dt = datetime.fromisoformat(last_synced)
+        if synced_dt.tzinfo is None:
+            synced_dt = synced_dt.replace(tzinfo=timezone.utc)
+        return (datetime.now(timezone.utc) - synced_dt) > timedelta(hours=STALE_THRESHOLD_HOURS)
     except (ValueError, TypeError):
         return True
 
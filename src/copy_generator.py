@@ -1,6 +1,9 @@
 """Claude API integration for generating replacement ad copy."""
 
 import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 import anthropic
@@ -11,6 +14,51 @@ logger = logging.getLogger("rising-pmax.copy_generator")
 
 MODEL = "claude-sonnet-4-20250514"
 MAX_TOKENS = 200
+LENGTH_SYSTEM_PROMPT = (
+    "Respond with at most {max_length} characters of plain replacement text: "
+    "no quotes, labels, or explanation."
+)
+
+# Bound each Claude call so a hung connection can't stall the weekly review
+CLAUDE_TIMEOUT = anthropic.Timeout(30.0, connect=5.0)
+
+# Invariant opening of every copy prompt (built once at import)
+_PROMPT_HEADER = f"""You are a copywriter for Rising Fishing, a fly fishing gear company. \
+Your task is to generate replacement copy for underperforming Google Ads assets.
+
+RISING VOICE GUIDELINES:
+{RISING_VOICE_GUIDELINES}
+
+WHAT WORKS:
+- Direct product focus: "Fly Fishing Nets"
+- Origin/credibility: "USA Made Fly Fishing Nets"
+- Material specificity: "Aluminum Nets"
+- Real conditions: "Built for Rivers and Big Fish"
+
+WHAT FAILS:
+- Hype language: "Innovative", "Premier", "Top-of-the-Line", "Unmatched"
+- Vague benefits: "Experience", "Destination"
+- Gatekeeping: "For Serious Anglers"
+- Hyperbole: "Nets That Land Monsters"
+"""
+
+# Most recent kills shown to Claude as "what has failed before"
+GRAVEYARD_PROMPT_LIMIT = 20
+
+# Max concurrent Claude calls when generating a batch of replacements
+REPLACEMENT_MAX_WORKERS = 8
+
+
+def _is_retryable(error: anthropic.APIError) -> bool:
+    """Rate limits, overload/5xx responses and connection failures are worth retrying."""
+    if isinstance(error, anthropic.APIStatusError):
+        return error.status_code == 429 or error.status_code >= 500
+    return isinstance(error, anthropic.APIConnectionError)
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with jitter so concurrent workers don't retry in lockstep."""
+    return min(30.0, 2 ** attempt + random.random())
 
 
 class CopyGenerator:
@@ -18,47 +66,57 @@ class CopyGenerator:
 
     def __init__(self, api_key: str):
         """Initialize Claude API client."""
-        self.client = anthropic.Anthropic(api_key=api_key)
+        # Retries are handled in generate_replacement, not by the SDK
+        self.client = anthropic.Anthropic(
+            api_key=api_key, max_retries=0, timeout=CLAUDE_TIMEOUT
+        )
         logger.info("Claude API client initialized (model: %s)", MODEL)
 
+    @staticmethod
+    def build_graveyard_section(graveyard: List[Dict[str, Any]]) -> str:
+        """Format the graveyard block shared by every prompt in a batch.
+
+        Covers the last GRAVEYARD_PROMPT_LIMIT kills. A text killed more than
+        once in that window appears once, with its latest kill reason and a
+        kill count, so repeats shrink the block rather than pull in older rows.
+        """
+        latest: Dict[str, Dict[str, Any]] = {}
+        kill_counts: Dict[str, int] = {}
+        for grave in graveyard[-GRAVEYARD_PROMPT_LIMIT:]:
+            key = grave.get("asset_text", "").strip().lower()
+            latest.pop(key, None)  # Re-insert so order follows each text's latest kill
+            latest[key] = grave
+            kill_counts[key] = kill_counts.get(key, 0) + 1
+
+        graveyard_lines = []
+        for key, grave in latest.items():
+            times = f" ({kill_counts[key]}x)" if kill_counts[key] > 1 else ""
+            graveyard_lines.append(
+                f"- \"{grave.get('asset_text', '')}\" ({grave.get('asset_type', '')}) "
+                f"- Killed{times}: {grave.get('kill_reason', 'unknown')}"
+            )
+        return "\n".join(graveyard_lines) if graveyard_lines else "None yet"
+
     def build_prompt(
         self,
         asset: Dict[str, Any],
         kill_reason: str,
         diagnosis: str,
         graveyard: List[Dict[str, Any]],
+        graveyard_section: Optional[str] = None,
     ) -> str:
-        """Construct the prompt for Claude."""
+        """Construct the prompt for Claude.
+
+        Pass a precomputed graveyard_section to skip re-formatting the
+        graveyard for each asset in a batch.
+        """
         asset_type = asset.get("asset_type", "HEADLINE")
         max_length = ASSET_CHARACTER_LIMITS.get(asset_type, 30)
 
-        # Build graveyard section
-        graveyard_lines = []
-        for grave in graveyard[-20:]:  # Last 20 killed assets
-            graveyard_lines.append(
-                f"- \"{grave.get('asset_text', '')}\" ({grave.get('asset_type', '')}) "
-                f"- Killed: {grave.get('kill_reason', 'unknown')}"
-            )
-        graveyard_section = "\n".join(graveyard_lines) if graveyard_lines else "None yet"
-
-        prompt = f"""You are a copywriter for Rising Fishing, a fly fishing gear company. \
-Your task is to generate replacement copy for underperforming Google Ads assets.
-
-RISING VOICE GUIDELINES:
-{RISING_VOICE_GUIDELINES}
-
-WHAT WORKS:
-- Direct product focus: "Fly Fishing Nets"
-- Origin/credibility: "USA Made Fly Fishing Nets"
-- Material specificity: "Aluminum Nets"
-- Real conditions: "Built for Rivers and Big Fish"
-
-WHAT FAILS:
-- Hype language: "Innovative", "Premier", "Top-of-the-Line", "Unmatched"
-- Vague benefits: "Experience", "Destination"
-- Gatekeeping: "For Serious Anglers"
-- Hyperbole: "Nets That Land Monsters"
+        if graveyard_section is None:
+            graveyard_section = self.build_graveyard_section(graveyard)
 
+        prompt = f"""{_PROMPT_HEADER}
 GRAVEYARD (what has failed before):
 {graveyard_section}
 
@@ -90,6 +148,7 @@ Replacement text:"""
         kill_reason: str,
         diagnosis: str,
         graveyard: List[Dict[str, Any]],
+        graveyard_section: Optional[str] = None,
     ) -> Optional[Dict[str, str]]:
         """Generate a single replacement for a killed asset.
 
@@ -98,13 +157,19 @@ Replacement text:"""
         asset_type = asset.get("asset_type", "HEADLINE")
         max_length = ASSET_CHARACTER_LIMITS.get(asset_type, 30)
 
-        prompt = self.build_prompt(asset, kill_reason, diagnosis, graveyard)
+        base_prompt = self.build_prompt(
+            asset, kill_reason, diagnosis, graveyard, graveyard_section=graveyard_section
+        )
+        prompt = base_prompt
+        # Hard length limit rides in the system prompt on every attempt
+        system = LENGTH_SYSTEM_PROMPT.format(max_length=max_length)
 
         for attempt in range(1, 4):
             try:
                 response = self.client.messages.create(
                     model=MODEL,
                     max_tokens=MAX_TOKENS,
+                    system=system,
                     messages=[{"role": "user", "content": prompt}],
                 )
 
@@ -119,8 +184,8 @@ Replacement text:"""
                         max_length,
                         len(replacement_text),
                     )
-                    # Add length reminder and retry
-                    prompt += (
+                    # Retry from the base prompt plus only the latest overshoot
+                    prompt = base_prompt + (
                         f"\n\nIMPORTANT: Your previous response was "
                         f"{len(replacement_text)} characters. "
                         f"Maximum is {max_length}. Try again, shorter:"
@@ -146,8 +211,9 @@ Replacement text:"""
                 logger.error(
                     "Claude API error (attempt %d/3): %s", attempt, e
                 )
-                if attempt == 3:
+                if attempt == 3 or not _is_retryable(e):
                     return None
+                time.sleep(_backoff_delay(attempt))
 
         return None
 
@@ -155,22 +221,31 @@ Replacement text:"""
         self,
         flagged_assets: List[Dict[str, Any]],
         graveyard: List[Dict[str, Any]],
+        max_workers: int = REPLACEMENT_MAX_WORKERS,
     ) -> Dict[str, Dict[str, str]]:
         """Generate replacements for all flagged assets.
 
-        Returns dict mapping asset_id to replacement info.
+        Claude calls run concurrently (up to max_workers); results keep the
+        order of flagged_assets. Returns dict mapping asset_id to replacement info.
         """
         replacements = {}
-
-        for asset in flagged_assets:
-            asset_id = asset.get("asset_id", "unknown")
-            kill_reason = asset.get("kill_reason", "unknown")
-            diagnosis = asset.get("diagnosis", "unknown")
-
-            result = self.generate_replacement(
-                asset, kill_reason, diagnosis, graveyard
+        graveyard_section = self.build_graveyard_section(graveyard)
+
+        def _generate(asset: Dict[str, Any]) -> Optional[Dict[str, str]]:
+            return self.generate_replacement(
+                asset,
+                asset.get("kill_reason", "unknown"),
+                asset.get("diagnosis", "unknown"),
+                graveyard,
+                graveyard_section=graveyard_section,
             )
 
+        workers = max(1, min(max_workers, len(flagged_assets)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_generate, flagged_assets))
+
+        for asset, result in zip(flagged_assets, results):
+            asset_id = asset.get("asset_id", "unknown")
             if result:
                 replacements[asset_id] = result
             else:
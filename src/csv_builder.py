@@ -49,6 +49,9 @@ class CSVBuilder:
         Returns list of row lists (including header).
         """
         today = get_today_mountain().replace("-", "_")
+        killed_label = f"killed_{today}"
+        added_label = f"added_{today}"
+        format_row = self._format_row
         rows = [CSV_HEADERS]
 
         for asset in flagged_assets:
@@ -57,14 +60,14 @@ class CSVBuilder:
 
             # PAUSE the underperformer
             rows.append(
-                self._format_row(
+                format_row(
                     action="PAUSE",
                     campaign=campaign_name,
                     asset_group=asset_group,
                     asset_type=asset_type,
                     text=asset.get("asset_text", ""),
                     status="PAUSED",
-                    label=f"killed_{today}",
+                    label=killed_label,
                 )
             )
 
@@ -72,14 +75,14 @@ class CSVBuilder:
             replacement = replacements.get(asset_id)
             if replacement:
                 rows.append(
-                    self._format_row(
+                    format_row(
                         action="ADD",
                         campaign=campaign_name,
                         asset_group=asset_group,
                         asset_type=asset_type,
                         text=replacement["text"],
                         status="ENABLED",
-                        label=f"added_{today}",
+                        label=added_label,
                     )
                 )
 
@@ -127,8 +130,7 @@ class CSVBuilder:
         filepath = os.path.join(output_dir, filename)
 
         with open(filepath, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerows(rows)
+            f.write(self.rows_to_string(rows))
 
         logger.info("Saved CSV to %s (%d data rows)", filepath, len(rows) - 1)
         return filepath
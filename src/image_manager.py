@@ -4,15 +4,22 @@ Handles S3 storage, Claude Vision analysis, image registry operations,
 gap analysis, and bootstrapping from Google Ads.
 """
 
+import base64
 import hashlib
 import json
 import logging
+import threading
 import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
 import boto3
 import requests
+from botocore.config import Config
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from config.settings import CAMPAIGNS, S3_IMAGE_BUCKET
 from database.queries import (
@@ -38,6 +45,74 @@ IMAGE_FIELD_TYPES = {
     "PORTRAIT_MARKETING_IMAGE",
 }
 
+# Max concurrent image downloads / Claude Vision calls during bootstrap
+BOOTSTRAP_MAX_WORKERS = 12
+
+# Long-lived so each worker thread keeps its DynamoDB resource across campaigns
+_bootstrap_executor = ThreadPoolExecutor(
+    max_workers=BOOTSTRAP_MAX_WORKERS, thread_name_prefix="bootstrap"
+)
+
+# Seconds to wait on a Google Ads image download
+IMAGE_DOWNLOAD_TIMEOUT_SECONDS = 30
+
+
+def _base64_source(image_bytes: bytes, content_type: str) -> Dict[str, str]:
+    """Messages API image source carrying the bytes inline."""
+    media_type = content_type if content_type in ("image/jpeg", "image/png", "image/webp", "image/gif") else "image/jpeg"
+    return {
+        "type": "base64",
+        "media_type": media_type,
+        "data": base64.b64encode(image_bytes).decode("utf-8"),
+    }
+
+
+def _is_linked_to_campaign(image: Dict[str, Any], campaign_name: str) -> bool:
+    """True if the image has a live (not unlinked) mapping in the campaign."""
+    return any(
+        m.get("campaign_name") == campaign_name and not m.get("date_unlinked")
+        for m in image.get("google_ads_assets", [])
+    )
+
+
+def _dedupe_campaign_images(
+    images: List[Dict[str, Any]], campaign_name: str
+) -> List[Dict[str, Any]]:
+    """Drop registry entries that duplicate an image already counted for a campaign.
+
+    Google recompresses uploads, so a bootstrapped copy can hash differently
+    from the original and end up as a second registry entry for the same
+    live asset_resource. An entry is dropped when its image_id was already
+    seen, or when all of its live mappings for this campaign point at
+    asset_resources an earlier entry covers. Order is preserved and the
+    input list is not modified.
+    """
+    if len(images) < 2:
+        return list(images)
+
+    seen_ids = set()
+    seen_resources = set()
+    result = []
+    for image in images:
+        image_id = image.get("image_id")
+        if image_id is not None and image_id in seen_ids:
+            continue
+
+        resources = {
+            mapping["asset_resource"]
+            for mapping in image.get("google_ads_assets", [])
+            if mapping.get("campaign_name") == campaign_name
+            and not mapping.get("date_unlinked")
+            and mapping.get("asset_resource")
+        }
+        if resources and resources <= seen_resources:
+            continue
+
+        if image_id is not None:
+            seen_ids.add(image_id)
+        seen_resources |= resources
+        result.append(image)
+    return result
 
 
 ASSET_GROUP_QUERY = """
@@ -140,16 +215,46 @@ Return ONLY a JSON array of strings, one recommendation per underrepresented cat
 Example: ["Shoot a close-up of the walnut net handle grain ...","Capture an angler mid-release on a river ..."]"""
 
 
+def _build_download_session() -> requests.Session:
+    """Return a keep-alive session for image downloads, one connection per bootstrap worker."""
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_maxsize=BOOTSTRAP_MAX_WORKERS, max_retries=retry),
+    )
+    return session
+
+
 class ImageManager:
     """Manages image assets in S3 and the image registry."""
 
     def __init__(self, anthropic_api_key: str, google_ads_collector=None, campaigns=None, campaign_config=None):
-        self.s3 = boto3.client("s3")
+        # One pooled connection per bootstrap worker; botocore defaults to 10
+        self.s3 = boto3.client(
+            "s3", config=Config(max_pool_connections=BOOTSTRAP_MAX_WORKERS)
+        )
         self.bucket = S3_IMAGE_BUCKET
         self.anthropic_key = anthropic_api_key
+        self._anthropic_headers = {
+            "x-api-key": anthropic_api_key,
+            "anthropic-version": "2023-06-01",
+            "content-type": "application/json",
+        }
         self.collector = google_ads_collector
         self.campaigns = campaigns if campaigns is not None else CAMPAIGNS
         self.campaign_config = campaign_config
+        self._http = _build_download_session()
+        # Full registry scan, reused until this manager writes to the registry
+        self._all_images_cache: Optional[List[Dict[str, Any]]] = None
+        # image_hash -> registry entry, loaded from the registry on first lookup
+        self._hash_index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._hash_index_lock = threading.Lock()
         logger.info("ImageManager initialized (bucket: %s)", self.bucket)
 
     # --- S3 Operations ---
@@ -179,21 +284,32 @@ class ImageManager:
         response = self.s3.get_object(Bucket=self.bucket, Key=s3_key)
         return response["Body"].read()
 
+    def presigned_url(self, s3_key: str, expires: int = 900) -> str:
+        """Return a time-limited GET URL for an object in the image bucket."""
+        return self.s3.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self.bucket, "Key": s3_key},
+            ExpiresIn=expires,
+        )
+
     # --- Claude Vision Analysis ---
 
     def analyze_image(
-        self, image_bytes: bytes, content_type: str = "image/jpeg", campaign_context: Optional[Dict[str, str]] = None
+        self,
+        image_bytes: bytes,
+        content_type: str = "image/jpeg",
+        campaign_context: Optional[Dict[str, str]] = None,
+        image_url: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Analyze an image using Claude Vision. Returns structured metadata.
 
+        When image_url is given, Claude fetches the image itself instead of
+        receiving it base64-encoded in the request body; if it can't fetch
+        the URL, the bytes are sent inline instead.
+
         When campaign_context is provided, also returns campaign_fit_score and
         campaign_fit_notes fields.
         """
-        import base64
-
-        media_type = content_type if content_type in ("image/jpeg", "image/png", "image/webp", "image/gif") else "image/jpeg"
-        b64_image = base64.b64encode(image_bytes).decode("utf-8")
-
         prompt = VISION_ANALYSIS_PROMPT
         if campaign_context:
             prompt += CAMPAIGN_CONTEXT_ADDENDUM.format(
@@ -205,13 +321,38 @@ class ImageManager:
                 tone_notes=campaign_context.get("tone_notes", ""),
             )
 
-        response = requests.post(
+        if image_url:
+            response = self._post_vision({"type": "url", "url": image_url}, prompt)
+            if response.status_code == 400:
+                logger.warning(
+                    "Claude Vision could not use image URL, sending inline: %s",
+                    response.text[:500],
+                )
+                response = self._post_vision(_base64_source(image_bytes, content_type), prompt)
+        else:
+            response = self._post_vision(_base64_source(image_bytes, content_type), prompt)
+
+        if not response.ok:
+            logger.error("Claude Vision API error %d: %s", response.status_code, response.text[:500])
+            raise RuntimeError(f"Claude Vision API {response.status_code}: {response.text[:500]}")
+
+        result = response.json()
+        text = result["content"][0]["text"]
+
+        # Parse JSON from response (handle potential markdown wrapping)
+        text = text.strip()
+        if text.startswith("```"):
+            text = text.split("\n", 1)[1].rsplit("```", 1)[0].strip()
+
+        analysis = json.loads(text)
+        logger.info("Image analyzed: category=%s, product=%s", analysis.get("content_category"), analysis.get("product_visible"))
+        return analysis
+
+    def _post_vision(self, source: Dict[str, str], prompt: str) -> requests.Response:
+        """POST one image + prompt to the Messages API."""
+        return requests.post(
             "https://api.anthropic.com/v1/messages",
-            headers={
-                "x-api-key": self.anthropic_key,
-                "anthropic-version": "2023-06-01",
-                "content-type": "application/json",
-            },
+            headers=self._anthropic_headers,
             json={
                 "model": "claude-sonnet-4-5-20250929",
                 "max_tokens": 1024,
@@ -221,11 +362,7 @@ class ImageManager:
                         "content": [
                             {
                                 "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": media_type,
-                                    "data": b64_image,
-                                },
+                                "source": source,
                             },
                             {
                                 "type": "text",
@@ -237,22 +374,6 @@ class ImageManager:
             },
         )
 
-        if not response.ok:
-            logger.error("Claude Vision API error %d: %s", response.status_code, response.text[:500])
-            raise RuntimeError(f"Claude Vision API {response.status_code}: {response.text[:500]}")
-
-        result = response.json()
-        text = result["content"][0]["text"]
-
-        # Parse JSON from response (handle potential markdown wrapping)
-        text = text.strip()
-        if text.startswith("```"):
-            text = text.split("\n", 1)[1].rsplit("```", 1)[0].strip()
-
-        analysis = json.loads(text)
-        logger.info("Image analyzed: category=%s, product=%s", analysis.get("content_category"), analysis.get("product_visible"))
-        return analysis
-
     # --- Registration ---
 
     def register_image(
@@ -263,13 +384,18 @@ class ImageManager:
         source: str = "manual_upload",
         google_ads_mapping: Optional[Dict[str, str]] = None,
         campaign_context: Optional[Dict[str, str]] = None,
+        image_hash: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Full pipeline: upload to S3, analyze with AI, save to registry.
 
+        Pass image_hash when the caller already has the SHA-256 of
+        image_bytes to skip hashing them again.
+
         Returns the complete registry entry.
         """
         image_id = str(uuid.uuid4())[:8]
-        image_hash = hashlib.sha256(image_bytes).hexdigest()
+        if image_hash is None:
+            image_hash = hashlib.sha256(image_bytes).hexdigest()
 
         # Check for duplicate by hash
         existing = self._find_by_hash(image_hash)
@@ -287,7 +413,12 @@ class ImageManager:
         aspect_ratio = self._classify_aspect_ratio(width, height)
 
         # Analyze with Claude Vision
-        analysis = self.analyze_image(image_bytes, content_type, campaign_context=campaign_context)
+        analysis = self.analyze_image(
+            image_bytes,
+            content_type,
+            campaign_context=campaign_context,
+            image_url=self.presigned_url(s3_key),
+        )
         crop_eligibility = analysis.pop("crop_eligibility", {})
 
         # Mark native slot
@@ -342,6 +473,10 @@ class ImageManager:
             entry["status"] = "in_use"
 
         save_image(entry)
+        with self._hash_index_lock:
+            if self._hash_index is not None:
+                self._hash_index[image_hash] = entry
+        self._registry_saved(entry)
         logger.info("Registered image %s: %s (%s)", image_id, analysis.get("content_category"), aspect_ratio)
         return entry
 
@@ -390,6 +525,7 @@ class ImageManager:
 
                 # Step 2: For each enabled asset group, get ENABLED images
                 live_asset_resources = set()
+                pending = []
                 for ag in enabled_groups:
                     ag_resource = ag["assetGroup"]["resourceName"]
                     ag_name = ag["assetGroup"]["name"]
@@ -406,18 +542,19 @@ class ImageManager:
                         asset_resource = row.get("assetGroupAsset", {}).get("asset", "")
                         if asset_resource:
                             live_asset_resources.add(asset_resource)
-                        try:
-                            entry = self._process_bootstrap_row(row, campaign_name, ag_name)
-                            if entry.get("_was_duplicate"):
-                                campaign_results["duplicate"] += 1
-                                results["duplicate"] += 1
-                            else:
-                                campaign_results["new"] += 1
-                                results["new"] += 1
-                        except Exception as e:
-                            logger.error("Failed to process image asset: %s", e)
-                            campaign_results["errors"] += 1
-                            results["errors"] += 1
+                        pending.append((row, ag_name))
+
+                # Step 3: Download, analyze, and register across all asset groups
+                for outcome in self._process_bootstrap_rows(pending, campaign_name):
+                    if outcome is None:
+                        campaign_results["errors"] += 1
+                        results["errors"] += 1
+                    elif outcome[1]:
+                        campaign_results["duplicate"] += 1
+                        results["duplicate"] += 1
+                    else:
+                        campaign_results["new"] += 1
+                        results["new"] += 1
 
                 # Reconcile: unlink images no longer in Google Ads
                 unlinked = self._reconcile_campaign_mappings(campaign_name, live_asset_resources)
@@ -459,10 +596,81 @@ class ImageManager:
             "tone_notes": manual.get("tone_notes", ""),
         }
 
-    def _process_bootstrap_row(
+    def _process_bootstrap_rows(
+        self, rows: List[Tuple[Dict[str, Any], str]], campaign_name: str
+    ) -> List[Optional[Tuple[Dict[str, Any], bool]]]:
+        """Process a campaign's (row, asset group) pairs concurrently during bootstrap.
+
+        Rows whose asset_resource the registry already maps are reported as
+        duplicates of that entry without downloading anything. The remaining
+        downloads run in parallel first. Rows are then grouped by image hash:
+        groups register (and call Claude Vision) in parallel, while rows that
+        share a hash run one after another so the image is registered once
+        and mapped for the rest. Returns one (entry, was_duplicate) pair per
+        row in input order, None where the row failed.
+        """
+        outcomes: List[Optional[Tuple[Dict[str, Any], bool]]] = [None] * len(rows)
+        if not rows:
+            return outcomes
+
+        images_by_resource: Dict[str, Dict[str, Any]] = {}
+        for image in self._get_all_images():
+            for m in image.get("google_ads_assets", []):
+                if m.get("asset_resource"):
+                    images_by_resource.setdefault(m["asset_resource"], image)
+
+        pending = []
+        for i, (row, _) in enumerate(rows):
+            existing = images_by_resource.get(row.get("assetGroupAsset", {}).get("asset"))
+            if existing is not None:
+                outcomes[i] = (existing, True)
+            else:
+                pending.append(i)
+        if len(pending) < len(rows):
+            logger.info(
+                "Skipping %d already-registered image assets for %s",
+                len(rows) - len(pending), campaign_name,
+            )
+        if not pending:
+            return outcomes
+
+        campaign_context = self._get_campaign_context(campaign_name)
+
+        def _download(i: int):
+            row, asset_group = rows[i]
+            try:
+                return self._download_bootstrap_row(row, campaign_name, asset_group)
+            except Exception as e:
+                logger.error("Failed to process image asset: %s", e)
+                return None
+
+        def _register(indexes: List[int]) -> None:
+            for i in indexes:
+                image_bytes, content_type, image_hash, mapping = downloads[i]
+                try:
+                    outcomes[i] = self._register_bootstrap_image(
+                        image_bytes, content_type, image_hash, mapping, campaign_context
+                    )
+                except Exception as e:
+                    logger.error("Failed to process image asset: %s", e)
+
+        downloads = dict(zip(pending, _bootstrap_executor.map(_download, pending)))
+
+        rows_by_hash: Dict[str, List[int]] = {}
+        for i, download in downloads.items():
+            if download is not None:
+                rows_by_hash.setdefault(download[2], []).append(i)
+        list(_bootstrap_executor.map(_register, rows_by_hash.values()))
+
+        return outcomes
+
+    def _download_bootstrap_row(
         self, row: Dict[str, Any], campaign_name: str, asset_group: str
-    ) -> Dict[str, Any]:
-        """Process a single Google Ads image asset row during bootstrap."""
+    ) -> Tuple[bytes, str, str, Dict[str, Any]]:
+        """Download a Google Ads image asset row.
+
+        Returns (image bytes, content type, SHA-256 hash, Google Ads mapping).
+        """
         aga = row.get("assetGroupAsset", {})
         asset = row.get("asset", {})
         image_asset = asset.get("imageAsset", {})
@@ -472,22 +680,16 @@ class ImageManager:
         asset_name = asset.get("name", "")
         field_type = aga.get("fieldType", "")
         image_url = full_size.get("url", "")
-        width = int(full_size.get("widthPixels", 0))
-        height = int(full_size.get("heightPixels", 0))
 
         if not image_url:
             raise ValueError(f"No image URL for asset {asset_resource}")
 
         # Download the image
-        resp = requests.get(image_url)
+        resp = self._http.get(image_url, timeout=IMAGE_DOWNLOAD_TIMEOUT_SECONDS)
         resp.raise_for_status()
         image_bytes = resp.content
         content_type = resp.headers.get("content-type", "image/jpeg")
 
-        # Check for duplicate
-        image_hash = hashlib.sha256(image_bytes).hexdigest()
-        existing = self._find_by_hash(image_hash)
-
         google_ads_mapping = {
             "asset_resource": asset_resource,
             "campaign_name": campaign_name,
@@ -496,24 +698,36 @@ class ImageManager:
             "asset_name": asset_name,
             "image_url": image_url,
         }
+        image_hash = hashlib.sha256(image_bytes).hexdigest()
+        return image_bytes, content_type, image_hash, google_ads_mapping
 
+    def _register_bootstrap_image(
+        self,
+        image_bytes: bytes,
+        content_type: str,
+        image_hash: str,
+        google_ads_mapping: Dict[str, Any],
+        campaign_context: Optional[Dict[str, str]],
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Map a downloaded image onto its registry entry, registering it if new.
+
+        Returns (entry, was_duplicate).
+        """
+        existing = self._find_by_hash(image_hash)
         if existing:
             self._add_google_ads_mapping(existing, google_ads_mapping)
-            existing["_was_duplicate"] = True
-            return existing
-
-        campaign_context = self._get_campaign_context(campaign_name)
+            return existing, True
 
         entry = self.register_image(
             image_bytes=image_bytes,
             content_type=content_type,
-            filename_original=asset_name,
+            filename_original=google_ads_mapping["asset_name"],
             source="google_ads_bootstrap",
             google_ads_mapping=google_ads_mapping,
             campaign_context=campaign_context,
+            image_hash=image_hash,
         )
-        entry["_was_duplicate"] = False
-        return entry
+        return entry, False
 
     # --- Gap Analysis ---
 
@@ -527,15 +741,20 @@ class ImageManager:
             raise ValueError(f"No image profile for campaign: {campaign_name}")
 
         profile = config["image_profile"]
-        images = get_images_for_campaign(campaign_name)
+        # One pass: images live in this campaign, and available unlinked
+        # images by category as gap-filling candidates
+        images = []
+        available_by_category: Dict[str, List[Dict[str, Any]]] = {}
+        for img in self._get_all_images():
+            if _is_linked_to_campaign(img, campaign_name):
+                images.append(img)
+            elif img.get("status") == "available":
+                available_by_category.setdefault(img.get("content_category"), []).append(img)
         total = len(images)
 
         # Count by category
-        category_counts = {cat: 0 for cat in CONTENT_CATEGORIES}
-        for image in images:
-            cat = image.get("content_category", "")
-            if cat in category_counts:
-                category_counts[cat] += 1
+        raw_counts = Counter(image.get("content_category") for image in images)
+        category_counts = {cat: raw_counts[cat] for cat in CONTENT_CATEGORIES}
 
         # Calculate gaps
         composition = {}
@@ -582,24 +801,14 @@ class ImageManager:
                     )
 
         # Find available (not in use) images that could fill gaps
-        all_images = get_all_images()
-        candidates = {}
-        under_categories = [cat for cat, d in priority if d["status"] == "under"]
-        for cat in under_categories:
-            matches = [
-                img for img in all_images
-                if img.get("content_category") == cat
-                and img.get("status") == "available"
-                and not any(
-                    m.get("campaign_name") == campaign_name and not m.get("date_unlinked")
-                    for m in img.get("google_ads_assets", [])
-                )
+        candidates = {
+            cat: [
+                {"image_id": m["image_id"], "description": m.get("ai_description", "")}
+                for m in available_by_category[cat][:3]
             ]
-            if matches:
-                candidates[cat] = [
-                    {"image_id": m["image_id"], "description": m.get("ai_description", "")}
-                    for m in matches[:3]
-                ]
+            for cat, data in priority
+            if data["status"] == "under" and cat in available_by_category
+        }
 
         result = {
             "campaign_name": campaign_name,
@@ -687,11 +896,7 @@ class ImageManager:
 
         response = requests.post(
             "https://api.anthropic.com/v1/messages",
-            headers={
-                "x-api-key": self.anthropic_key,
-                "anthropic-version": "2023-06-01",
-                "content-type": "application/json",
-            },
+            headers=self._anthropic_headers,
             json={
                 "model": "claude-sonnet-4-5-20250929",
                 "max_tokens": 1024,
@@ -755,13 +960,43 @@ class ImageManager:
             return "portrait"
         return "square"
 
+    def _get_all_images(self) -> List[Dict[str, Any]]:
+        """All registry images, scanned once and reused until this manager saves."""
+        if self._all_images_cache is None:
+            self._all_images_cache = get_all_images()
+        return self._all_images_cache
+
+    def _registry_saved(self, image: Dict[str, Any]) -> None:
+        """Keep the registry caches consistent after save_image(image).
+
+        The registry scan is always dropped. The hash index is kept only when
+        it holds this exact dict for the image's hash, i.e. the write went
+        through the indexed entry; any other saved copy (e.g. from
+        reconciliation) makes the index stale, so it is rebuilt on next lookup.
+        """
+        self._all_images_cache = None
+        with self._hash_index_lock:
+            if (
+                self._hash_index is not None
+                and self._hash_index.get(image.get("image_hash")) is not image
+            ):
+                self._hash_index = None
+
     def _find_by_hash(self, image_hash: str) -> Optional[Dict[str, Any]]:
         """Find an existing image by SHA-256 hash."""
-        all_images = get_all_images()
-        for image in all_images:
-            if image.get("image_hash") == image_hash:
-                return image
-        return None
+        with self._hash_index_lock:
+            if self._hash_index is None:
+                self._hash_index = self._load_hash_index()
+            return self._hash_index.get(image_hash)
+
+    def _load_hash_index(self) -> Dict[str, Dict[str, Any]]:
+        """Scan the registry once into an image_hash -> entry index (first entry wins)."""
+        index: Dict[str, Dict[str, Any]] = {}
+        for image in self._get_all_images():
+            image_hash = image.get("image_hash")
+            if image_hash:
+                index.setdefault(image_hash, image)
+        return index
 
     def _reconcile_campaign_mappings(self, campaign_name: str, live_asset_resources: set) -> int:
         """Unlink registry mappings no longer present in Google Ads.
@@ -790,6 +1025,7 @@ class ImageManager:
 
             if updated:
                 save_image(image)
+                self._registry_saved(image)
 
         if unlinked_count:
             logger.info("Unlinked %d stale mappings for %s", unlinked_count, campaign_name)
@@ -813,6 +1049,7 @@ class ImageManager:
         image["google_ads_assets"] = existing_mappings
         image["status"] = "in_use"
         save_image(image)
+        self._registry_saved(image)
         logger.info(
             "Added Google Ads mapping to image %s: %s in %s",
             image["image_id"],
@@ -12,7 +12,7 @@ sys.path.insert(
     0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 )
 
-from src.analyzer import AssetAnalyzer, calculate_budget_recommendation
+from src.analyzer import Asset, AssetAnalyzer, calculate_budget_recommendation
 from database.queries import generate_asset_id
 
 TEST_DATA_DIR = os.path.join(os.path.dirname(__file__), "test_data")
@@ -238,6 +238,37 @@ class TestNewAssetProtection:
         assert analyzer.is_new_asset(asset) is False
 
 
+class TestAssetModel:
+    """Test the slotted Asset record and its dict shim."""
+
+    def test_from_dict_casts_numeric_fields(self):
+        asset = Asset.from_dict({
+            "asset_text": "Fly Fishing Nets",
+            "asset_type": "HEADLINE",
+            "impressions": "1200",
+            "ctr": "3.5",
+            "date_added": "2025-01-01",
+        })
+        assert asset.impressions == 1200
+        assert asset.ctr == 3.5
+        assert asset.status == "active"
+
+    def test_asset_is_slotted(self):
+        asset = Asset()
+        assert not hasattr(asset, "__dict__")
+
+    def test_analyzer_accepts_asset_and_dict(self):
+        analyzer = AssetAnalyzer(month=6)
+        data = {
+            "asset_text": "Nice Fishing Stuff",
+            "asset_type": "HEADLINE",
+            "impressions": 1000,
+            "ctr": 1.0,
+            "date_added": "2025-01-01",
+        }
+        assert analyzer.should_kill(data) == analyzer.should_kill(Asset.from_dict(data))
+
+
 class TestDiagnosis:
     """Test failure diagnosis logic."""
 
@@ -6,7 +6,7 @@ from unittest.mock import MagicMock, patch
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.image_manager import ASSET_GROUP_QUERY, IMAGE_ASSET_QUERY
+from src.image_manager import ASSET_GROUP_QUERY, IMAGE_ASSET_QUERY, _dedupe_campaign_images
 
 
 def test_asset_group_query_filters_by_campaign_resource():
@@ -65,18 +65,21 @@ def test_bootstrap_queries_enabled_asset_groups():
         }
     }
 
-    with patch("src.image_manager.requests.get") as mock_get, \
+    with patch("src.image_manager.requests.Session.get") as mock_get, \
          patch("src.image_manager.requests.post") as mock_post, \
          patch("src.image_manager.save_image"), \
          patch("src.image_manager.get_all_images", return_value=[]), \
          patch("src.image_manager.get_images_for_campaign", return_value=[]):
 
-        # Mock image download
-        mock_response = MagicMock()
-        mock_response.content = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100  # fake PNG
-        mock_response.headers = {"content-type": "image/png"}
-        mock_response.ok = True
-        mock_get.return_value = mock_response
+        # Mock image download — distinct bytes per URL so each is a new image
+        def fake_download(url, **kwargs):
+            mock_response = MagicMock()
+            mock_response.content = b"\x89PNG\r\n\x1a\n" + url.encode()  # fake PNG
+            mock_response.headers = {"content-type": "image/png"}
+            mock_response.ok = True
+            return mock_response
+
+        mock_get.side_effect = fake_download
 
         # Mock Claude Vision analysis
         mock_vision = MagicMock()
@@ -101,6 +104,31 @@ def test_bootstrap_queries_enabled_asset_groups():
     assert results["by_campaign"]["Core Brand"]["new"] == 20
 
 
+def test_dedupe_campaign_images_collapses_shared_asset_resource():
+    """Two registry entries for one live asset_resource count once; input is untouched."""
+    def image(image_id, resource, campaign="Core Brand", unlinked=None):
+        return {
+            "image_id": image_id,
+            "google_ads_assets": [
+                {"campaign_name": campaign, "asset_resource": resource, "date_unlinked": unlinked},
+            ],
+        }
+
+    images = [
+        image("a", "customers/1/assets/1"),
+        image("b", "customers/1/assets/1"),  # recompressed copy of a
+        image("c", "customers/1/assets/2"),
+        image("c", "customers/1/assets/2"),  # same entry listed twice
+        image("d", "customers/1/assets/1", unlinked="2025-01-01T00:00:00Z"),
+    ]
+    original = list(images)
+
+    deduped = _dedupe_campaign_images(images, "Core Brand")
+
+    assert [i["image_id"] for i in deduped] == ["a", "c", "d"]
+    assert images == original
+
+
 def _make_image_row(asset_resource, name, field_type):
     return {
         "assetGroupAsset": {